@@ -8,6 +8,7 @@ let NFPC = [];
 let NFTC = [];
 let LOG = { lastRun: null, records: [] };
 let SNAP = { nfpc:{}, nftc:{} };
+let UPCOMING = { items: [] };
 
 function badge(text){
   return text === "변경 없음"
@@ -75,6 +76,21 @@ function renderLogs(){
   $("logList").innerHTML = rows || `<div class="small">로그가 없습니다.</div>`;
 }
 
+function renderUpcoming(){
+  const items = UPCOMING.items || [];
+  $("upcomingRange").textContent = UPCOMING.from ? `${UPCOMING.from} 기준 ${UPCOMING.days}일 이내` : "";
+  $("upcomingList").innerHTML = items.map(x=>`
+    <div class="upItem" data-code="${esc(x.code)}" data-tab="${esc((x.scope||"").toLowerCase())}">
+      <span class="dday">${x.daysLeft === 0 ? "D-DAY" : `D-${esc(x.daysLeft)}`}</span>
+      <b>${esc(x.code)}</b> <span class="small">${esc(x.effectiveDate)} · ${esc(x.revisionType||"-")}</span>
+    </div>
+  `).join("") || `<div class="small">예정된 시행 항목이 없습니다.</div>`;
+
+  document.querySelectorAll(".upItem").forEach(el=>{
+    el.addEventListener("click", ()=> openStd(el.dataset.tab, el.dataset.code));
+  });
+}
+
 function openStd(tab, code){
   const list = tab==="nfpc" ? NFPC : NFTC;
   const s = list.find(x=>x.code===code);
@@ -123,16 +139,18 @@ function downloadJson(){
 }
 
 async function init(){
-  const [nfpc,nftc,log,snap] = await Promise.all([
+  const [nfpc,nftc,log,snap,upcoming] = await Promise.all([
     fetch("./standards_nfpc.json",{cache:"no-store"}).then(r=>r.json()),
     fetch("./standards_nftc.json",{cache:"no-store"}).then(r=>r.json()),
     fetch("./data.json",{cache:"no-store"}).then(r=>r.json()),
-    fetch("./snapshot.json",{cache:"no-store"}).then(r=>r.json()).catch(()=>({nfpc:{},nftc:{}}))
+    fetch("./snapshot.json",{cache:"no-store"}).then(r=>r.json()).catch(()=>({nfpc:{},nftc:{}})),
+    fetch("./upcoming.json",{cache:"no-store"}).then(r=>r.json()).catch(()=>({items:[]}))
   ]);
   NFPC = nfpc.items || [];
   NFTC = nftc.items || [];
   LOG = log;
   SNAP = snap;
+  UPCOMING = upcoming;
 
   $("lastRun").textContent = `마지막 자동검토: ${LOG.lastRun || "-"}`;
 
@@ -152,5 +170,6 @@ async function init(){
 
   renderStandards();
   renderLogs();
+  renderUpcoming();
 }
 init();
@@ -0,0 +1,252 @@
+"""변경 감지 파이프라인 동등성 검사 + 규모별 벤치마크.
+
+합성 DRF 응답(10 ~ 100k 항목, AdmRulSearch/admrulSearch/admrul/law, 단건 dict/리스트 혼합)을
+생성해 기존 구현(ref_*)과 check_updates의 현재 구현이 같은 결과를 내는지 확인하고,
+구간별 소요 시간·메모리 피크를 기록한다.
+
+    python scripts/bench_pipeline.py                         # 동등성 검사 + 벤치마크
+    python scripts/bench_pipeline.py --baseline bench.json   # 기준치와 비교 (없으면 생성)
+"""
+import argparse
+import hashlib
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import check_updates as cu
+
+SIZES = [10, 100, 1_000, 10_000, 100_000]
+TITLES = ["소화기구 및 자동소화장치", "옥내소화전설비", "스프링클러설비", "간이스프링클러설비", "화재조기진압용 스프링클러설비"]
+ORGS = ["소방청", "행정안전부", "국토교통부"]
+
+
+# Reference (pre-optimization) implementations
+def ref_extract_items(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
+    candidates = []
+
+    adm = payload.get("AdmRulSearch") or payload.get("admrulSearch")
+    if isinstance(adm, dict):
+        candidates.extend(cu.to_list(adm.get("admrul")))
+
+    for key in ["admrul", "law", "items", "results"]:
+        candidates.extend(cu.to_list(payload.get(key)))
+
+    seen = set()
+    out = []
+    for item in candidates:
+        sig = hashlib.sha256(json.dumps(item, ensure_ascii=False, sort_keys=True).encode("utf-8")).hexdigest()
+        if sig in seen:
+            continue
+        seen.add(sig)
+        out.append(item)
+    return out
+
+
+def ref_pick_best_item(items: List[Dict[str, Any]], std: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    if not items:
+        return None
+
+    title = (std.get("title") or "").strip().lower()
+    org = (std.get("orgName") or "").strip().lower()
+
+    def score(x: Dict[str, Any]) -> int:
+        name = str(x.get("법령명한글") or x.get("법령명") or x.get("행정규칙명") or "").lower()
+        dept = str(x.get("소관부처") or x.get("소관부처명") or "").lower()
+        s = 0
+        if title and title in name:
+            s += 5
+        if org and org in dept:
+            s += 2
+        if x.get("현행연혁코드") == "현행":
+            s += 1
+        return s
+
+    return sorted(items, key=score, reverse=True)[0]
+
+
+# Synthetic payloads
+def gen_item(rng: random.Random, i: int) -> Dict[str, Any]:
+    name_key = rng.choice(["행정규칙명", "법령명한글", "법령명"])
+    dept_key = rng.choice(["소관부처", "소관부처명"])
+    item: Dict[str, Any] = {
+        name_key: rng.choice(TITLES) + rng.choice(["", "의 화재안전성능기준", "의 화재안전기술기준"]),
+        dept_key: rng.choice(ORGS),
+        "발령번호": str(rng.randint(1, 40)),
+        "발령일자": f"20{rng.randint(10, 26):02d}{rng.randint(1, 12):02d}{rng.randint(1, 28):02d}",
+        "시행일자": f"20{rng.randint(10, 27):02d}{rng.randint(1, 12):02d}{rng.randint(1, 28):02d}",
+        "seq": i % max(1, rng.randint(1, 4) * 50),  # 의도적인 중복 생성
+    }
+    if rng.random() < 0.5:
+        item["현행연혁코드"] = rng.choice(["현행", "연혁"])
+    if rng.random() < 0.1:
+        item.pop("발령번호")
+    return item
+
+
+def wrap(rng: random.Random, items: List[Any]) -> Any:
+    # 1건이면 DRF처럼 dict 단건으로 내려오는 경우를 섞는다.
+    if len(items) == 1 and rng.random() < 0.5:
+        return items[0]
+    return items
+
+
+LAYOUTS = ["AdmRulSearch", "admrulSearch", "admrul", "law", "mixed"]
+
+
+def gen_payload(rng: random.Random, n: int, variant: str = "") -> Dict[str, Any]:
+    items: List[Any] = [gen_item(rng, i) for i in range(n)]
+    if items and rng.random() < 0.2:
+        items.insert(rng.randrange(len(items)), "not-a-dict")
+
+    variant = variant or rng.choice(LAYOUTS)
+    if variant in ("AdmRulSearch", "admrulSearch"):
+        return {variant: {"totalCnt": str(n), "admrul": wrap(rng, items)}}
+    if variant in ("admrul", "law"):
+        return {variant: wrap(rng, items)}
+
+    cut = rng.randint(0, len(items))
+    return {
+        "AdmRulSearch": {"admrul": wrap(rng, items[:cut])},
+        "admrul": wrap(rng, items[cut // 2:]),  # 겹치는 구간은 중복 제거 대상
+        "results": wrap(rng, items[cut:]),
+    }
+
+
+def gen_std(rng: random.Random, i: int) -> Dict[str, Any]:
+    title = rng.choice(TITLES)
+    return {"code": f"NFPC {100 + i}", "title": title, "query": title, "orgName": rng.choice(ORGS + [""])}
+
+
+# Equivalence
+def strip_volatile(snap: Dict[str, Any]) -> Dict[str, Any]:
+    return {code: {k: v for k, v in item.items() if k != "checkedAt"} for code, item in snap.items()}
+
+
+def run_process_scope(payloads: Dict[str, Dict[str, Any]], standards: List[Dict[str, Any]], prev: Dict[str, Any],
+                      extract: Callable, pick: Callable) -> Tuple[Dict[str, Any], List[Dict[str, str]]]:
+    saved = (cu.http_get_json, cu.extract_items, cu.pick_best_item)
+    cu.http_get_json = lambda url, params: payloads.get(params["query"])
+    cu.extract_items, cu.pick_best_item = extract, pick
+    fd, path = tempfile.mkstemp(suffix=".json")
+    os.close(fd)
+    try:
+        cu.save_json(path, {"items": standards})
+        return cu.process_scope("NFPC", path, prev)
+    finally:
+        os.unlink(path)
+        cu.http_get_json, cu.extract_items, cu.pick_best_item = saved
+
+
+def check_equivalence(seed: int, rounds: int) -> int:
+    rng = random.Random(seed)
+    for r in range(rounds):
+        n = rng.choice([0, 1, 2, 3, 10, 50, 200, 1000])
+        payload = gen_payload(rng, n)
+        std = gen_std(rng, r)
+
+        ref_items = ref_extract_items(payload)
+        cur_items = cu.extract_items(payload)
+        assert ref_items == cur_items, f"extract_items mismatch (seed={seed}, round={r}, n={n})"
+        assert ref_pick_best_item(ref_items, std) == cu.pick_best_item(cur_items, std), \
+            f"pick_best_item mismatch (seed={seed}, round={r}, n={n})"
+
+    standards = [gen_std(rng, i) for i in range(30)]
+    payloads = {t: gen_payload(rng, rng.randint(0, 300)) for t in TITLES}
+    prev_snap, _ = run_process_scope(payloads, standards[:15], {}, ref_extract_items, ref_pick_best_item)
+    payloads = {t: gen_payload(rng, rng.randint(0, 300)) for t in TITLES[:3]}  # 일부는 NOT_FOUND로 전환
+    ref = run_process_scope(payloads, standards, prev_snap, ref_extract_items, ref_pick_best_item)
+    cur = run_process_scope(payloads, standards, prev_snap, cu.extract_items, cu.pick_best_item)
+    assert strip_volatile(ref[0]) == strip_volatile(cur[0]), f"process_scope snapshot mismatch (seed={seed})"
+    assert ref[1] == cur[1], f"process_scope changes mismatch (seed={seed})"
+    return rounds + 1
+
+
+# Benchmark
+def measure(fn: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"seconds": round(best, 6), "peakKiB": round(peak / 1024, 1)}
+
+
+def bench(sizes: List[int], seed: int) -> Dict[str, Dict[str, float]]:
+    rng = random.Random(seed)
+    std = gen_std(rng, 0)
+    results: Dict[str, Dict[str, float]] = {}
+    for n in sizes:
+        repeat = 5 if n <= 10_000 else 2
+        for layout in LAYOUTS:
+            payload = gen_payload(rng, n, layout)
+            items = cu.extract_items(payload)
+            assert items == ref_extract_items(payload), f"extract_items mismatch ({layout}, n={n})"
+            cases = {
+                "extract_items.ref": lambda: ref_extract_items(payload),
+                "extract_items": lambda: cu.extract_items(payload),
+                "pick_best_item.ref": lambda: ref_pick_best_item(items, std),
+                "pick_best_item": lambda: cu.pick_best_item(items, std),
+            }
+            for name, fn in cases.items():
+                results[f"{name}[{layout},{n}]"] = measure(fn, repeat)
+    return results
+
+
+def compare_baseline(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]], tolerance: float) -> List[str]:
+    regressions = []
+    for name, cur in results.items():
+        base = baseline.get(name)
+        if not base or name.split("[")[0].endswith(".ref"):
+            continue
+        # 아주 짧은 구간은 측정 잡음이 커서 1ms 미만 차이는 무시
+        if cur["seconds"] > base["seconds"] * tolerance and cur["seconds"] - base["seconds"] > 0.001:
+            regressions.append(f"{name}: {base['seconds']:.4f}s -> {cur['seconds']:.4f}s")
+        if cur["peakKiB"] > base["peakKiB"] * tolerance and cur["peakKiB"] - base["peakKiB"] > 64:
+            regressions.append(f"{name}: {base['peakKiB']:.0f}KiB -> {cur['peakKiB']:.0f}KiB")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="NFPC/NFTC 파이프라인 동등성 검사 및 벤치마크")
+    parser.add_argument("--seeds", type=int, default=20, help="동등성 검사 시드 수")
+    parser.add_argument("--rounds", type=int, default=50, help="시드당 무작위 payload 수")
+    parser.add_argument("--max-size", type=int, default=SIZES[-1])
+    parser.add_argument("--baseline", default="", help="기준치 JSON 경로 (없으면 현재 결과로 생성)")
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=1.5)
+    args = parser.parse_args()
+
+    cases = sum(check_equivalence(seed, args.rounds) for seed in range(args.seeds))
+    print(f"equivalence: {cases} cases OK")
+
+    results = bench([n for n in SIZES if n <= args.max_size], seed=0)
+    for name, r in results.items():
+        print(f"{name:<44} {r['seconds']:>10.4f}s {r['peakKiB']:>12.1f}KiB")
+
+    if not args.baseline:
+        return
+    if args.update_baseline or not os.path.exists(args.baseline):
+        cu.save_json(args.baseline, results)
+        print(f"baseline written: {args.baseline}")
+        return
+
+    regressions = compare_baseline(results, cu.load_json(args.baseline, {}), args.tolerance)
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    if regressions:
+        sys.exit(1)
+    print("baseline: no regressions")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,839 +1,1529 @@
-diff --git a/scripts/check_updates.py b/scripts/check_updates.py
-index d31cf6d13a545254712d8d456d2bb2ce002615ce..518516f41824b04cd4d96ef36ee72a8074e72566 100644
---- a/scripts/check_updates.py
-+++ b/scripts/check_updates.py
-@@ -1,574 +1,260 @@
-- (cd "$(git rev-parse --show-toplevel)" && git apply --3way <<'EOF' 
--diff --git a/scripts/check_updates.py b/scripts/check_updates.py
--index fb65a9fffd4fd32ecc71990e346d47a4885b6360..b190677542646867bb80e8edf4627cf1573e2d9d 100644
----- a/scripts/check_updates.py
--+++ b/scripts/check_updates.py
--@@ -1,384 +1,422 @@
---import os, json, hashlib, urllib.parse, time, random
---from datetime import datetime, timezone, timedelta
---from typing import Any, Dict, Tuple, Optional
---
---import requests
--+import hashlib
--+import json
--+import os
--+import random
--+import time
--+import urllib.error
--+import urllib.parse
--+import urllib.request
--+from datetime import datetime, timedelta, timezone
--+from typing import Any, Dict, List, Optional, Tuple
-- 
-- 
-- # =====================
-- # Config
-- # =====================
-- KST = timezone(timedelta(hours=9))
-- TODAY = datetime.now(KST).strftime("%Y-%m-%d")
-- 
-- LAWGO_OC = os.getenv("LAWGO_OC", "").strip()
-- if not LAWGO_OC:
---    raise SystemExit("ENV LAWGO_OC is empty. Set GitHub Secret 'LAWGO_OC' to your 법제처 OPEN API OC value (email id).")
--+    raise SystemExit(
--+        "ENV LAWGO_OC is empty. Set GitHub Secret 'LAWGO_OC' to your 법제처 OPEN API OC value (email id)."
--+    )
-- 
---# ✅ https 고정
-- LAW_SEARCH = "https://www.law.go.kr/DRF/lawSearch.do"
-- LAW_SERVICE = "https://www.law.go.kr/DRF/lawService.do"
-- 
---TIMEOUT = 30
---MAX_RETRIES = 4
--+TIMEOUT = int(os.getenv("LAWGO_TIMEOUT", "15"))
--+MAX_RETRIES = int(os.getenv("LAWGO_MAX_RETRIES", "3"))
-- 
-- 
-- # =====================
-- # Helpers (file I/O)
-- # =====================
-- def load(path: str, default: Any) -> Any:
--     try:
--         with open(path, "r", encoding="utf-8") as f:
--             return json.load(f)
--     except FileNotFoundError:
--         return default
-- 
--+
-- def save(path: str, obj: Any) -> None:
--     with open(path, "w", encoding="utf-8") as f:
--         json.dump(obj, f, ensure_ascii=False, indent=2)
-- 
--+
-- def ymd_int_to_dot(v: Any) -> Any:
--     if v is None:
--         return None
--     s = str(v).strip()
--     if not s.isdigit() or len(s) != 8:
--         return s
--     return f"{s[0:4]}.{s[4:6]}.{s[6:8]}"
-- 
---def sha256_text(t: str) -> str:
---    return hashlib.sha256((t or "").encode("utf-8")).hexdigest()
--+
--+def sha256_text(text: str) -> str:
--+    return hashlib.sha256((text or "").encode("utf-8")).hexdigest()
-- 
-- 
-- # =====================
-- # HTTP (robust)
-- # =====================
--+def _backoff(attempt: int) -> None:
--+    # 0.5s, 1.0s, 2.0s ... + jitter
--+    base = 0.5 * (2 ** (attempt - 1))
--+    time.sleep(base + random.random() * 0.4)
--+
--+
-- def _request_json(url: str, params: Dict[str, str]) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
---    """
---    Returns: (json_payload, error_info)
---      - json_payload: parsed dict if success
---      - error_info: dict with debug fields if failed (no secret exposure)
---    """
---    session = requests.Session()
---    last_err = None
--+    last_err: Optional[Dict[str, Any]] = None
--+    headers = {
--+        "Accept": "application/json,*/*;q=0.8",
--+        "User-Agent": "NFPC-NFTC-Automated-Review-System/1.0",
--+    }
--+
--+    query = urllib.parse.urlencode(params, doseq=False, safe="")
--+    request_url = f"{url}?{query}"
-- 
--     for attempt in range(1, MAX_RETRIES + 1):
--+        req = urllib.request.Request(request_url, headers=headers, method="GET")
--+
--         try:
---            r = session.get(url, params=params, timeout=TIMEOUT, allow_redirects=True)
---            ct = (r.headers.get("Content-Type") or "").lower()
---            text = r.text or ""
--+            with urllib.request.urlopen(req, timeout=TIMEOUT) as response:
--+                status = getattr(response, "status", response.getcode())
--+                content_type = (response.headers.get("Content-Type") or "").lower()
--+                text = response.read().decode("utf-8", errors="replace")
--+
--             head = text[:200].replace("\n", " ")
-- 
---            # status not ok
---            if r.status_code != 200:
--+            if status != 200:
--                 last_err = {
--                     "kind": "http_error",
---                    "status": r.status_code,
---                    "contentType": ct,
--+                    "status": status,
--+                    "contentType": content_type,
--                     "head": head,
--                     "url": url,
--                 }
---                # 429/5xx는 재시도 가치 큼
---                if r.status_code in (429, 500, 502, 503, 504):
--+                if status in (429, 500, 502, 503, 504):
--                     _backoff(attempt)
--                     continue
--                 return None, last_err
-- 
---            # content type not json (HTML/empty/blocked)
---            if "json" not in ct:
---                # 빈 응답도 여기로 들어옴
--+            if "json" not in content_type:
--                 last_err = {
--                     "kind": "not_json",
---                    "status": r.status_code,
---                    "contentType": ct,
--+                    "status": status,
--+                    "contentType": content_type,
--                     "head": head,
--                     "url": url,
--                 }
---                # 일시 오류 가능 → 재시도
--                 _backoff(attempt)
--                 continue
-- 
---            # try parse json
--             try:
---                return r.json(), None
---            except Exception as e:
--+                payload = json.loads(text)
--+            except Exception as e:  # noqa: BLE001
--                 last_err = {
--                     "kind": "json_parse_fail",
---                    "status": r.status_code,
---                    "contentType": ct,
--+                    "status": status,
--+                    "contentType": content_type,
--                     "head": head,
--                     "url": url,
--                     "error": str(e),
--                 }
--                 _backoff(attempt)
--                 continue
-- 
---        except requests.RequestException as e:
--+            if not isinstance(payload, dict):
--+                last_err = {
--+                    "kind": "json_type_error",
--+                    "status": status,
--+                    "contentType": content_type,
--+                    "head": head,
--+                    "url": url,
--+                }
--+                _backoff(attempt)
--+                continue
--+
--+            return payload, None
--+
--+        except urllib.error.HTTPError as e:
--+            body = ""
--+            try:
--+                body = e.read().decode("utf-8", errors="replace")
--+            except Exception:
--+                body = ""
--+
--+            last_err = {
--+                "kind": "http_error",
--+                "status": e.code,
--+                "contentType": (e.headers.get("Content-Type") or "").lower() if e.headers else "",
--+                "head": body[:200].replace("\n", " "),
--+                "url": url,
--+                "error": str(e),
--+            }
--+            if e.code in (429, 500, 502, 503, 504):
--+                _backoff(attempt)
--+                continue
--+            return None, last_err
--+
--+        except (urllib.error.URLError, TimeoutError, OSError) as e:
--             last_err = {
--                 "kind": "request_exception",
--                 "url": url,
--                 "error": str(e),
--             }
--             _backoff(attempt)
--             continue
-- 
--     return None, last_err
-- 
---def _backoff(attempt: int) -> None:
---    # 0.6s, 1.2s, 2.4s... + jitter
---    base = 0.6 * (2 ** (attempt - 1))
---    time.sleep(base + random.random() * 0.4)
---
-- 
-- # =====================
-- # Law.go API wrappers
-- # =====================
-- def lawgo_search(query: str, knd: int = 3, display: int = 20) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
--     params = {
--         "OC": LAWGO_OC,
--         "target": "admrul",
--         "type": "JSON",
--         "query": query,
--         "knd": str(knd),
--         "display": str(display),
--         "sort": "ddes",
--     }
---print("STATUS", r.status_code)
---print("CT", r.headers.get("Content-Type"))
---print("HEAD", (r.text or "")[:200].replace("\n", " "))
--     return _request_json(LAW_SEARCH, params)
-- 
--+
-- def lawgo_detail(admrul_id: str) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
--     params = {
--         "OC": LAWGO_OC,
--         "target": "admrul",
--         "type": "JSON",
--         "ID": str(admrul_id),
--     }
--     return _request_json(LAW_SERVICE, params)
-- 
-- 
-- # =====================
---# Picking / parsing
--+# Parsing / selection
-- # =====================
---def pick_best_item(items, org_name="소방청"):
---    best = None
--+def pick_best_item(items: List[Dict[str, Any]], org_name: str = "소방청") -> Optional[Dict[str, Any]]:
--+    best: Optional[Dict[str, Any]] = None
--     best_score = -1
--+
--     for it in items or []:
--         org = (it.get("소관부처명") or it.get("소관부처") or "")
--         kind = (it.get("행정규칙종류") or "")
--+
--         score = 0
--         if org_name and org_name in org:
--             score += 100
--         if "고시" in kind:
--             score += 20
--         if it.get("발령일자"):
--             score += 1
--+
--         if score > best_score:
---            best, best_score = it, score
--+            best = it
--+            best_score = score
--+
--     return best
-- 
---def _extract_items(search_json: Dict[str, Any]) -> list:
---    for k in ("admrul", "Admrul", "admruls"):
---        if k in search_json:
---            return search_json.get(k) or []
---    if "행정규칙" in search_json and isinstance(search_json["행정규칙"], list):
--+
--+def _extract_items(search_json: Dict[str, Any]) -> List[Dict[str, Any]]:
--+    for key in ("admrul", "Admrul", "admruls"):
--+        value = search_json.get(key)
--+        if isinstance(value, list):
--+            return value
--+
--+    if isinstance(search_json.get("행정규칙"), list):
--         return search_json["행정규칙"]
--+
--     return []
-- 
--+
-- def _extract_payload(detail_json: Dict[str, Any]) -> Dict[str, Any]:
---    # 상세 구조 다양성 대응
---    if isinstance(detail_json.get("행정규칙"), dict):
---        return detail_json["행정규칙"]
---    if isinstance(detail_json.get("admrul"), dict):
---        return detail_json["admrul"]
--+    for key in ("행정규칙", "admrul"):
--+        value = detail_json.get(key)
--+        if isinstance(value, dict):
--+            return value
--     return detail_json
-- 
-- 
--+def _admrul_html_url(adm_id: Any, best: Dict[str, Any]) -> str:
--+    html_url = best.get("행정규칙상세링크") or best.get("상세링크") or ""
--+    if html_url:
--+        return str(html_url)
--+
--+    encoded_id = urllib.parse.quote(str(adm_id))
--+    encoded_oc = urllib.parse.quote(LAWGO_OC)
--+    return f"{LAW_SERVICE}?OC={encoded_oc}&target=admrul&ID={encoded_id}&type=HTML"
--+
--+
-- # =====================
-- # Snapshot builder
-- # =====================
---def build_snapshot_entry(std_item: Dict[str, Any], tab_key: str, prev_entry: Dict[str, Any]) -> Dict[str, Any]:
--+def build_snapshot_entry(std_item: Dict[str, Any], prev_entry: Dict[str, Any]) -> Dict[str, Any]:
--     query = std_item.get("query") or std_item.get("title") or std_item.get("code")
--     knd = int(std_item.get("knd", 3))
--     org_name = std_item.get("orgName", "소방청")
-- 
---    # 1) search
---    sj, err = lawgo_search(query, knd=knd)
---    if err:
--+    search_json, search_err = lawgo_search(query=query, knd=knd)
--+    if search_err:
--         return {
--             **(prev_entry or {}),
--             "code": std_item.get("code"),
--             "title": std_item.get("title"),
--             "checkedAt": TODAY,
---            "error": {
---                "where": "search",
---                **err,
---                "query": query,
---            },
--+            "error": {"where": "search", **search_err, "query": query},
--         }
-- 
---    items = _extract_items(sj or {})
--+    items = _extract_items(search_json or {})
--     best = pick_best_item(items, org_name=org_name)
--     if not best:
--         return {
--             **(prev_entry or {}),
--             "code": std_item.get("code"),
--             "title": std_item.get("title"),
--             "checkedAt": TODAY,
--             "error": {"where": "search", "kind": "no_results", "query": query},
--         }
-- 
--     adm_id = best.get("행정규칙일련번호") or best.get("일련번호") or best.get("id") or best.get("ID")
--     if not adm_id:
--         return {
--             **(prev_entry or {}),
--             "code": std_item.get("code"),
--             "title": std_item.get("title"),
--             "checkedAt": TODAY,
--             "error": {"where": "search", "kind": "id_missing", "query": query},
--         }
-- 
---    # 2) detail
---    dj, derr = lawgo_detail(str(adm_id))
---    if derr:
--+    detail_json, detail_err = lawgo_detail(str(adm_id))
--+    if detail_err:
--         return {
--             **(prev_entry or {}),
--             "code": std_item.get("code"),
--             "title": std_item.get("title"),
--             "checkedAt": TODAY,
--             "lawgoId": str(adm_id),
---            "error": {"where": "detail", **derr},
--+            "error": {"where": "detail", **detail_err},
--         }
-- 
---    payload = _extract_payload(dj or {})
---
---    notice_no = payload.get("발령번호")
---    announce = ymd_int_to_dot(payload.get("발령일자"))
---    effective = ymd_int_to_dot(payload.get("시행일자"))
---    rev = payload.get("제개정구분명")
---    org = payload.get("소관부처명")
---    name = payload.get("행정규칙명") or std_item.get("title")
---
---    body_hash = sha256_text(payload.get("조문내용") or "")
---    add_hash = sha256_text((payload.get("부칙내용") or "") + (payload.get("별표내용") or ""))
---
---    html_url = best.get("행정규칙상세링크") or best.get("상세링크") or ""
---    if not html_url:
---        html_url = f"{LAW_SERVICE}?OC={urllib.parse.quote(LAWGO_OC)}&target=admrul&ID={adm_id}&type=HTML"
--+    payload = _extract_payload(detail_json or {})
-- 
--     return {
--         "code": std_item.get("code"),
--         "title": std_item.get("title"),
--         "checkedAt": TODAY,
--         "lawgoId": str(adm_id),
---        "noticeNo": notice_no,
---        "announceDate": announce,
---        "effectiveDate": effective,
---        "revisionType": rev,
---        "orgName": org,
---        "ruleName": name,
---        "htmlUrl": html_url,
---        "bodyHash": body_hash,
---        "suppHash": add_hash,
--+        "noticeNo": payload.get("발령번호"),
--+        "announceDate": ymd_int_to_dot(payload.get("발령일자")),
--+        "effectiveDate": ymd_int_to_dot(payload.get("시행일자")),
--+        "revisionType": payload.get("제개정구분명"),
--+        "orgName": payload.get("소관부처명"),
--+        "ruleName": payload.get("행정규칙명") or std_item.get("title"),
--+        "htmlUrl": _admrul_html_url(adm_id, best),
--+        "bodyHash": sha256_text(payload.get("조문내용") or ""),
--+        "suppHash": sha256_text((payload.get("부칙내용") or "") + (payload.get("별표내용") or "")),
--     }
-- 
---def detect_change(prev: Dict[str, Any], cur: Dict[str, Any]) -> Tuple[bool, list]:
--+
--+def detect_change(prev: Dict[str, Any], cur: Dict[str, Any]) -> Tuple[bool, List[str]]:
--     if not prev:
--         return False, []
--+
--     if prev.get("error") or cur.get("error"):
---        # 에러 상태 변화도 기록 가치가 있음
--         if (prev.get("error") or "") != (cur.get("error") or ""):
--             return True, ["error"]
--         return False, []
--+
--     keys = ["noticeNo", "announceDate", "effectiveDate", "revisionType", "bodyHash", "suppHash"]
---    diffs = [k for k in keys if (prev.get(k) or "") != (cur.get(k) or "")]
---    return (len(diffs) > 0), diffs
--+    diffs = [key for key in keys if (prev.get(key) or "") != (cur.get(key) or "")]
--+    return len(diffs) > 0, diffs
-- 
-- 
-- # =====================
-- # Main
-- # =====================
---def main():
--+def main() -> None:
--     nfpc = load("standards_nfpc.json", {"items": []})
--     nftc = load("standards_nftc.json", {"items": []})
--     snap = load("snapshot.json", {"nfpc": {}, "nftc": {}})
--     data = load("data.json", {"lastRun": None, "records": []})
-- 
---    changes = []
---    errors = []
--+    changes: List[Dict[str, Any]] = []
--+    errors: List[Dict[str, Any]] = []
-- 
--     for tab_key, std in (("nfpc", nfpc), ("nftc", nftc)):
--         for item in std.get("items", []):
--             code = item.get("code")
--             if not code:
--                 continue
-- 
--             prev = (snap.get(tab_key, {}) or {}).get(code, {})
---            cur = build_snapshot_entry(item, tab_key, prev)
--+            cur = build_snapshot_entry(item, prev)
--             snap.setdefault(tab_key, {})[code] = cur
-- 
---            # 에러 누적
--             if cur.get("error"):
---                errors.append({
---                    "code": code,
---                    "title": item.get("title"),
---                    "where": cur["error"].get("where"),
---                    "kind": cur["error"].get("kind"),
---                    "status": cur["error"].get("status"),
---                    "contentType": cur["error"].get("contentType"),
---                    "head": cur["error"].get("head"),
---                    "url": cur["error"].get("url"),
---                })
--+                errors.append(
--+                    {
--+                        "code": code,
--+                        "title": item.get("title"),
--+                        "where": cur["error"].get("where"),
--+                        "kind": cur["error"].get("kind"),
--+                        "status": cur["error"].get("status"),
--+                        "contentType": cur["error"].get("contentType"),
--+                        "head": cur["error"].get("head"),
--+                        "url": cur["error"].get("url"),
--+                    }
--+                )
-- 
--             changed, diff_keys = detect_change(prev, cur)
--             if changed and not cur.get("error"):
---                changes.append({
---                    "code": code,
---                    "title": item.get("title"),
---                    "noticeNo": cur.get("noticeNo"),
---                    "announceDate": cur.get("announceDate"),
---                    "effectiveDate": cur.get("effectiveDate"),
---                    "reason": f"자동 감지: 메타/본문 해시 변경({', '.join(diff_keys)})",
---                    "diff": [],
---                    "supplementary": "부칙/경과규정은 원문 확인",
---                    "impact": [
---                        "설계: 시행일 기준 적용(도서·시방서에 적용기준 명시)",
---                        "시공: 자재/설비 선정 시 개정기준 충족 여부 확인",
---                        "유지관리: 점검대장에 적용기준/이력 기록",
---                    ],
---                    "refs": [{"label": "법제처(원문/DRF)", "url": cur.get("htmlUrl", "")}],
---                })
--+                changes.append(
--+                    {
--+                        "code": code,
--+                        "title": item.get("title"),
--+                        "noticeNo": cur.get("noticeNo"),
--+                        "announceDate": cur.get("announceDate"),
--+                        "effectiveDate": cur.get("effectiveDate"),
--+                        "reason": f"자동 감지: 메타/본문 해시 변경({', '.join(diff_keys)})",
--+                        "diff": [],
--+                        "supplementary": "부칙/경과규정은 원문 확인",
--+                        "impact": [
--+                            "설계: 시행일 기준 적용(도서·시방서에 적용기준 명시)",
--+                            "시공: 자재/설비 선정 시 개정기준 충족 여부 확인",
--+                            "유지관리: 점검대장에 적용기준/이력 기록",
--+                        ],
--+                        "refs": [{"label": "법제처(원문/DRF)", "url": cur.get("htmlUrl", "")}],
--+                    }
--+                )
-- 
--     data["lastRun"] = TODAY
-- 
---    if changes:
---        result = "변경 있음"
---        summary = f"자동 감지: {len(changes)}건 변경(원문 확인 권장)"
---    else:
---        result = "변경 없음"
---        summary = "전일 대비 변경 감지 없음"
--+    result = "변경 있음" if changes else "변경 없음"
--+    summary = f"자동 감지: {len(changes)}건 변경(원문 확인 권장)" if changes else "전일 대비 변경 감지 없음"
-- 
---    # 에러가 있어도 워크플로는 “성공”으로 두고, 기록만 남김
--     rec = {
--         "id": TODAY,
--         "date": TODAY,
--         "scope": "NFPC / NFTC (법제처 OPEN API: 행정규칙)",
--         "result": result,
--         "summary": summary,
--         "changes": changes,
--         "errors": errors,
--         "refs": [],
--     }
-- 
---    # 같은 날짜 있으면 교체
--     data["records"] = [r for r in data.get("records", []) if r.get("date") != TODAY]
--     data["records"].insert(0, rec)
-- 
--     save("snapshot.json", snap)
--     save("data.json", data)
-- 
---    # 에러가 많아도 exit 0 (운영 지속)
--     print(f"Done. changes={len(changes)} errors={len(errors)} date={TODAY}")
-- 
--+
-- if __name__ == "__main__":
--     main()
-- 
--EOF
--)
-+import hashlib
-+import json
-+import os
-+import random
-+import time
-+import urllib.parse
-+import urllib.request
-+from datetime import datetime, timedelta, timezone
-+from typing import Any, Dict, List, Optional, Tuple
-+
-+KST = timezone(timedelta(hours=9))
-+TODAY = datetime.now(KST).strftime("%Y-%m-%d")
-+
-+LAWGO_OC = os.getenv("LAWGO_OC", "").strip()
-+if not LAWGO_OC:
-+    raise SystemExit("ENV LAWGO_OC is empty. Set GitHub Secret 'LAWGO_OC'.")
-+
-+LAW_SEARCH_URL = "https://www.law.go.kr/DRF/lawSearch.do"
-+TIMEOUT = int(os.getenv("LAWGO_TIMEOUT", "6"))
-+MAX_RETRIES = int(os.getenv("LAWGO_MAX_RETRIES", "2"))
-+
-+
-+def load_json(path: str, default: Any) -> Any:
-+    try:
-+        with open(path, "r", encoding="utf-8") as f:
-+            return json.load(f)
-+    except FileNotFoundError:
-+        return default
-+
-+
-+def save_json(path: str, data: Any) -> None:
-+    with open(path, "w", encoding="utf-8") as f:
-+        json.dump(data, f, ensure_ascii=False, indent=2)
-+
-+
-+def sha256_text(text: str) -> str:
-+    return hashlib.sha256((text or "").encode("utf-8")).hexdigest()
-+
-+
-+def normalize_date(v: Any) -> str:
-+    if v is None:
-+        return ""
-+    s = str(v).strip()
-+    if s.isdigit() and len(s) == 8:
-+        return f"{s[0:4]}.{s[4:6]}.{s[6:8]}"
-+    return s
-+
-+
-+def backoff(attempt: int) -> None:
-+    base = 0.6 * (2 ** (attempt - 1))
-+    time.sleep(base + random.random() * 0.35)
-+
-+
-+def http_get_json(url: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-+    query = urllib.parse.urlencode(params, doseq=False, safe="")
-+    req_url = f"{url}?{query}"
-+    headers = {
-+        "Accept": "application/json,*/*;q=0.8",
-+        "User-Agent": "NFPC-NFTC-Auto-Review/1.0",
-+    }
-+
-+    for attempt in range(1, MAX_RETRIES + 1):
-+        req = urllib.request.Request(req_url, headers=headers, method="GET")
-+        try:
-+            with urllib.request.urlopen(req, timeout=TIMEOUT) as resp:
-+                body = resp.read().decode("utf-8", errors="replace")
-+                if not body:
-+                    raise ValueError("empty response")
-+                return json.loads(body)
-+        except Exception:
-+            if attempt == MAX_RETRIES:
-+                return None
-+            backoff(attempt)
-+    return None
-+
-+
-+def to_list(obj: Any) -> List[Dict[str, Any]]:
-+    if obj is None:
-+        return []
-+    if isinstance(obj, list):
-+        return [x for x in obj if isinstance(x, dict)]
-+    if isinstance(obj, dict):
-+        return [obj]
-+    return []
-+
-+
-+def extract_items(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
-+    candidates = []
-+
-+    adm = payload.get("AdmRulSearch") or payload.get("admrulSearch")
-+    if isinstance(adm, dict):
-+        candidates.extend(to_list(adm.get("admrul")))
-+
-+    # fallback patterns for schema variations
-+    for key in ["admrul", "law", "items", "results"]:
-+        candidates.extend(to_list(payload.get(key)))
-+
-+    # dedupe by serialized hash
-+    seen = set()
-+    out = []
-+    for item in candidates:
-+        sig = sha256_text(json.dumps(item, ensure_ascii=False, sort_keys=True))
-+        if sig in seen:
-+            continue
-+        seen.add(sig)
-+        out.append(item)
-+    return out
-+
-+
-+def pick_best_item(items: List[Dict[str, Any]], std: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-+    if not items:
-+        return None
-+
-+    title = (std.get("title") or "").strip().lower()
-+    org = (std.get("orgName") or "").strip().lower()
-+
-+    def score(x: Dict[str, Any]) -> int:
-+        name = str(x.get("법령명한글") or x.get("법령명") or x.get("행정규칙명") or "").lower()
-+        dept = str(x.get("소관부처") or x.get("소관부처명") or "").lower()
-+        s = 0
-+        if title and title in name:
-+            s += 5
-+        if org and org in dept:
-+            s += 2
-+        if x.get("현행연혁코드") == "현행":
-+            s += 1
-+        return s
-+
-+    return sorted(items, key=score, reverse=True)[0]
-+
-+
-+def build_snapshot_item(std: Dict[str, Any], api_item: Optional[Dict[str, Any]]) -> Dict[str, Any]:
-+    if not api_item:
-+        return {
-+            "code": std.get("code"),
-+            "title": std.get("title"),
-+            "checkedAt": datetime.now(KST).isoformat(timespec="seconds"),
-+            "status": "NOT_FOUND",
-+            "noticeNo": "",
-+            "announceDate": "",
-+            "effectiveDate": "",
-+            "revisionType": "",
-+            "htmlUrl": "",
-+            "bodyHash": "",
-+            "sourceHash": "",
-+        }
-+
-+    source_hash = sha256_text(json.dumps(api_item, ensure_ascii=False, sort_keys=True))
-+    html_url = api_item.get("법령상세링크") or api_item.get("상세링크") or ""
-+
-+    return {
-+        "code": std.get("code"),
-+        "title": std.get("title"),
-+        "checkedAt": datetime.now(KST).isoformat(timespec="seconds"),
-+        "status": "FOUND",
-+        "noticeNo": str(api_item.get("공포번호") or api_item.get("발령번호") or ""),
-+        "announceDate": normalize_date(api_item.get("공포일자") or api_item.get("발령일자") or ""),
-+        "effectiveDate": normalize_date(api_item.get("시행일자") or ""),
-+        "revisionType": str(api_item.get("제개정구분명") or api_item.get("제개정구분") or ""),
-+        "htmlUrl": str(html_url),
-+        "bodyHash": source_hash,
-+        "sourceHash": source_hash,
-+    }
-+
-+
-+def query_standard(std: Dict[str, Any]) -> Dict[str, Any]:
-+    query = (std.get("query") or std.get("title") or "").strip()
-+    if not query:
-+        return build_snapshot_item(std, None)
-+
-+    # 국가법령정보센터 행정규칙 검색
-+    params = {
-+        "OC": LAWGO_OC,
-+        "target": "admrul",
-+        "type": "JSON",
-+        "query": query,
-+        "display": "20",
-+    }
-+
-+    payload = http_get_json(LAW_SEARCH_URL, params)
-+    if not payload:
-+        return build_snapshot_item(std, None)
-+
-+    items = extract_items(payload)
-+    best = pick_best_item(items, std)
-+    return build_snapshot_item(std, best)
-+
-+
-+def compare(prev: Optional[Dict[str, Any]], cur: Dict[str, Any]) -> bool:
-+    if not prev:
-+        return True
-+    keys = ["status", "noticeNo", "announceDate", "effectiveDate", "revisionType", "bodyHash"]
-+    return any((prev.get(k) or "") != (cur.get(k) or "") for k in keys)
-+
-+
-+def process_scope(scope_name: str, standards_file: str, prev_scope_snap: Dict[str, Any]) -> Tuple[Dict[str, Any], List[Dict[str, str]]]:
-+    standards = load_json(standards_file, {"items": []}).get("items", [])
-+    new_scope_snap: Dict[str, Any] = {}
-+    changes: List[Dict[str, str]] = []
-+
-+    for std in standards:
-+        code = std.get("code")
-+        if not code:
-+            continue
-+
-+        cur = query_standard(std)
-+        prev = prev_scope_snap.get(code)
-+        if compare(prev, cur):
-+            changes.append({
-+                "scope": scope_name,
-+                "code": code,
-+                "title": std.get("title", ""),
-+                "status": cur.get("status", ""),
-+            })
-+        new_scope_snap[code] = cur
-+
-+        time.sleep(0.15)
-+
-+    return new_scope_snap, changes
-+
-+
-+def main() -> None:
-+    data = load_json("data.json", {"lastRun": None, "records": []})
-+    snapshot = load_json("snapshot.json", {"nfpc": {}, "nftc": {}})
-+
-+    nfpc_new, nfpc_changes = process_scope("NFPC", "standards_nfpc.json", snapshot.get("nfpc", {}))
-+    nftc_new, nftc_changes = process_scope("NFTC", "standards_nftc.json", snapshot.get("nftc", {}))
-+
-+    all_changes = nfpc_changes + nftc_changes
-+    result = "변경 있음" if all_changes else "변경 없음"
-+    summary = f"NFPC 변경 {len(nfpc_changes)}건 / NFTC 변경 {len(nftc_changes)}건"
-+
-+    record = {
-+        "date": TODAY,
-+        "scope": "NFPC/NFTC",
-+        "result": result,
-+        "summary": summary,
-+        "changes": all_changes,
-+    }
-+
-+    records = data.get("records", [])
-+    if records and records[0].get("date") == TODAY:
-+        records[0] = record
-+    else:
-+        records.insert(0, record)
-+
-+    data["lastRun"] = datetime.now(KST).isoformat(timespec="seconds")
-+    data["records"] = records[:365]
-+
-+    snapshot["nfpc"] = nfpc_new
-+    snapshot["nftc"] = nftc_new
-+
-+    save_json("data.json", data)
-+    save_json("snapshot.json", snapshot)
-+
-+    print(summary)
-+
-+
-+if __name__ == "__main__":
-+    main()
+import argparse
+import bisect
+import hashlib
+import json
+import os
+import random
+import smtplib
+import sqlite3
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from email.message import EmailMessage
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+KST = timezone(timedelta(hours=9))
+TODAY = datetime.now(KST).strftime("%Y-%m-%d")
+
+# 쉼표로 구분해 여러 OC 키를 등록하면 키 풀로 요청을 분산한다.
+LAWGO_OC_KEYS = list(dict.fromkeys(k.strip() for k in os.getenv("LAWGO_OC", "").split(",") if k.strip()))
+
+LAW_SEARCH_URL = "https://www.law.go.kr/DRF/lawSearch.do"
+LAW_SERVICE_URL = "https://www.law.go.kr/DRF/lawService.do"
+LAW_BASE_URL = "https://www.law.go.kr"
+TIMEOUT = int(os.getenv("LAWGO_TIMEOUT", "6"))
+MAX_RETRIES = int(os.getenv("LAWGO_MAX_RETRIES", "2"))
+
+KEY_STATE_FILE = "key_state.json"
+KEY_MIN_INTERVAL = float(os.getenv("LAWGO_KEY_MIN_INTERVAL", "0.15"))
+KEY_DAILY_QUOTA = int(os.getenv("LAWGO_KEY_DAILY_QUOTA", "0"))  # 0 = 무제한
+KEY_COOLDOWN = int(os.getenv("LAWGO_KEY_COOLDOWN", "600"))
+KEY_MAX_WAIT = float(os.getenv("LAWGO_KEY_MAX_WAIT", "30"))
+# 503은 law.go.kr 일반 장애에도 쓰이므로 기본값에서는 한도 초과로 보지 않는다.
+RATE_LIMIT_STATUS = {int(x) for x in os.getenv("LAWGO_RATE_LIMIT_STATUS", "429").split(",") if x.strip()}
+
+HISTORY_FILE = "history.json"
+UPCOMING_FILE = "upcoming.json"
+UPCOMING_DAYS = int(os.getenv("UPCOMING_DAYS", "30"))
+
+STATE_BACKEND = os.getenv("STATE_BACKEND", "json").strip().lower()  # json | sqlite
+STATE_DB = os.getenv("STATE_DB", "state.db")
+
+CACHE_DIR = os.getenv("LAWGO_CACHE_DIR", ".cache/lawgo")
+BACKFILL_WORKERS = int(os.getenv("LAWGO_BACKFILL_WORKERS", "4"))
+BACKFILL_CACHE_TTL = int(os.getenv("LAWGO_BACKFILL_CACHE_TTL", str(7 * 86400)))
+BACKFILL_DISPLAY = 100
+BACKFILL_MAX_PAGES = 10
+
+ATTACHMENTS_ENABLED = os.getenv("ATTACHMENTS", "0") == "1"
+ATTACHMENT_DIR = os.getenv("ATTACHMENT_DIR", "attachments")
+ATTACHMENT_MANIFEST = "attachments.json"
+ATTACHMENT_WORKERS = int(os.getenv("ATTACHMENT_WORKERS", "4"))
+ATTACHMENT_CHUNK = 64 * 1024
+
+METRICS_TEXTFILE = os.getenv("METRICS_TEXTFILE", "").strip()
+METRICS_PORT = int(os.getenv("METRICS_PORT", "9108"))
+SERVE_INTERVAL = int(os.getenv("SERVE_INTERVAL", "86400"))
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+NOTIFY_STATE_FILE = "notify_state.json"
+NOTIFY_MAX_RETRIES = int(os.getenv("NOTIFY_MAX_RETRIES", "3"))
+NOTIFY_JOIN_TIMEOUT = float(os.getenv("NOTIFY_JOIN_TIMEOUT", "60"))
+NOTIFY_KEEP_DAYS = 90
+
+
+def load_json(path: str, default: Any) -> Any:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return default
+
+
+def save_json(path: str, data: Any) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def sha256_text(text: str) -> str:
+    return hashlib.sha256((text or "").encode("utf-8")).hexdigest()
+
+
+def normalize_date(v: Any) -> str:
+    if v is None:
+        return ""
+    s = str(v).strip()
+    if s.isdigit() and len(s) == 8:
+        return f"{s[0:4]}.{s[4:6]}.{s[6:8]}"
+    return s
+
+
+def parse_date(v: Any) -> Optional[date]:
+    # normalize_date 결과(YYYY.MM.DD)와 원본(YYYYMMDD), ISO(YYYY-MM-DD)를 모두 허용
+    digits = "".join(ch for ch in str(v or "") if ch.isdigit())
+    if len(digits) != 8:
+        return None
+    try:
+        return date(int(digits[0:4]), int(digits[4:6]), int(digits[6:8]))
+    except ValueError:
+        return None
+
+
+def backoff(attempt: int) -> None:
+    base = 0.6 * (2 ** (attempt - 1))
+    time.sleep(base + random.random() * 0.35)
+
+
+METRIC_HELP = {
+    "lawgo_request_duration_seconds": ("histogram", "law.go.kr DRF request latency per attempt"),
+    "lawgo_requests_total": ("counter", "law.go.kr DRF request attempts by outcome"),
+    "lawgo_request_retries_total": ("counter", "law.go.kr DRF request retries"),
+    "lawgo_key_pool_exhausted_total": ("counter", "Requests dropped because no OC key was available"),
+    "nfpc_standards_skipped_total": ("counter", "Standards skipped (previous snapshot kept) because the key pool was exhausted"),
+    "lawgo_cache_requests_total": ("counter", "Fetch cache lookups by result"),
+    "nfpc_attachment_downloads_total": ("counter", "Attachment downloads by result"),
+    "nfpc_standards_checked": ("gauge", "Standards checked in the last run"),
+    "nfpc_not_found": ("gauge", "Standards reported NOT_FOUND in the last run"),
+    "nfpc_changes": ("gauge", "Changes detected in the last run"),
+    "nfpc_run_duration_seconds": ("gauge", "Duration of the last check run"),
+    "nfpc_last_run_timestamp_seconds": ("gauge", "Unix time the last check run finished"),
+    "nfpc_run_failures_total": ("counter", "Check runs that raised an error (serve mode)"),
+}
+
+
+class Metrics:
+    """Prometheus 텍스트 포맷으로 내보내는 최소 메트릭 레지스트리 (스레드 안전)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], float] = {}
+        self._hist: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], List[float]] = {}
+
+    @staticmethod
+    def _key(name: str, labels: Optional[Dict[str, str]]) -> Tuple[str, Tuple[Tuple[str, str], ...]]:
+        return name, tuple(sorted((labels or {}).items()))
+
+    def inc(self, name: str, labels: Optional[Dict[str, str]] = None, value: float = 1.0) -> None:
+        k = self._key(name, labels)
+        with self._lock:
+            self._values[k] = self._values.get(k, 0.0) + value
+
+    def set(self, name: str, value: float, labels: Optional[Dict[str, str]] = None) -> None:
+        with self._lock:
+            self._values[self._key(name, labels)] = float(value)
+
+    def observe(self, name: str, value: float, labels: Optional[Dict[str, str]] = None) -> None:
+        k = self._key(name, labels)
+        with self._lock:
+            # [bucket counts..., +Inf count, sum]
+            h = self._hist.setdefault(k, [0.0] * (len(LATENCY_BUCKETS) + 2))
+            for i, le in enumerate(LATENCY_BUCKETS):
+                if value <= le:
+                    h[i] += 1
+            h[-2] += 1
+            h[-1] += value
+
+    def render(self) -> str:
+        def fmt(labels: Tuple[Tuple[str, str], ...], extra: Tuple[Tuple[str, str], ...] = ()) -> str:
+            pairs = labels + extra
+            if not pairs:
+                return ""
+            escaped = (str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, v in pairs)
+            return "{" + ",".join(f'{k}="{v}"' for (k, _), v in zip(pairs, escaped)) + "}"
+
+        with self._lock:
+            values = dict(self._values)
+            hist = {k: list(v) for k, v in self._hist.items()}
+
+        lines: List[str] = []
+        for name in sorted({k[0] for k in values} | {k[0] for k in hist}):
+            kind, help_text = METRIC_HELP.get(name, ("untyped", name))
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for (n, labels), v in sorted(values.items()):
+                if n == name:
+                    lines.append(f"{name}{fmt(labels)} {v:.15g}")
+            for (n, labels), h in sorted(hist.items()):
+                if n != name:
+                    continue
+                for le, count in zip(LATENCY_BUCKETS, h):
+                    lines.append(f"{name}_bucket{fmt(labels, (('le', f'{le:g}'),))} {count:.15g}")
+                lines.append(f"{name}_bucket{fmt(labels, (('le', '+Inf'),))} {h[-2]:.15g}")
+                lines.append(f"{name}_sum{fmt(labels)} {h[-1]:.6f}")
+                lines.append(f"{name}_count{fmt(labels)} {h[-2]:.15g}")
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path: str) -> None:
+        # node_exporter textfile collector가 쓰는 중인 파일을 읽지 않도록 교체 방식으로 기록
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(self.render())
+        os.replace(tmp, path)
+
+
+METRICS = Metrics()
+
+
+def key_id(key: str) -> str:
+    # 상태 파일에는 키 원문 대신 해시 일부만 남긴다.
+    return sha256_text(key)[:12]
+
+
+class KeyPool:
+    """OC 키별 호출 간격·일일 쿼터·격리 상태를 관리하는 스케줄러."""
+
+    def __init__(self, keys: List[str], state: Dict[str, Any]):
+        self._lock = threading.Lock()
+        self._keys = list(keys)
+        self._next_at = {k: 0.0 for k in self._keys}
+        self._state: Dict[str, Dict[str, Any]] = dict(state)
+        for k in self._keys:
+            st = dict(self._state.get(key_id(k)) or {})
+            if st.get("date") != TODAY:
+                st["date"] = TODAY
+                st["used"] = 0
+            st.setdefault("used", 0)
+            st.setdefault("limited", 0)
+            st.setdefault("quarantinedUntil", 0)
+            self._state[key_id(k)] = st
+
+    def _st(self, key: str) -> Dict[str, Any]:
+        return self._state[key_id(key)]
+
+    def acquire(self) -> Optional[str]:
+        with self._lock:
+            now = time.time()
+            eligible = [k for k in self._keys if not KEY_DAILY_QUOTA or self._st(k)["used"] < KEY_DAILY_QUOTA]
+            if not eligible:
+                return None
+
+            def ready_at(k: str) -> float:
+                return max(self._next_at[k], float(self._st(k)["quarantinedUntil"]))
+
+            key = min(eligible, key=lambda k: (ready_at(k), self._st(k)["used"]))
+            start = max(now, ready_at(key))
+            if start - now > KEY_MAX_WAIT:
+                return None
+            self._next_at[key] = start + KEY_MIN_INTERVAL
+            self._st(key)["used"] += 1
+
+        if start > now:
+            time.sleep(start - now)
+        return key
+
+    def quarantine(self, key: str) -> bool:
+        """다른 키를 바로 쓸 수 있을 때만 key를 격리한다. 격리했으면 True."""
+        with self._lock:
+            st = self._st(key)
+            st["limited"] += 1
+            now = time.time()
+            alternatives = [
+                k for k in self._keys
+                if k != key
+                and (not KEY_DAILY_QUOTA or self._st(k)["used"] < KEY_DAILY_QUOTA)
+                and float(self._st(k)["quarantinedUntil"]) <= now
+            ]
+            if not alternatives:
+                return False
+            st["quarantinedUntil"] = int(now + KEY_COOLDOWN)
+            return True
+
+    def state(self) -> Dict[str, Any]:
+        with self._lock:
+            return {k: dict(v) for k, v in self._state.items()}
+
+
+class KeyPoolExhausted(Exception):
+    """쿼터 소진·대기 한도 초과로 쓸 수 있는 OC 키가 없음 (조회 결과가 아니라 스케줄링 결과)."""
+
+
+_KEY_POOL: Optional[KeyPool] = None
+
+
+def key_pool() -> KeyPool:
+    global _KEY_POOL
+    if _KEY_POOL is None:
+        if not LAWGO_OC_KEYS:
+            raise SystemExit("ENV LAWGO_OC is empty. Set GitHub Secret 'LAWGO_OC'.")
+        _KEY_POOL = KeyPool(LAWGO_OC_KEYS, load_json(KEY_STATE_FILE, {}))
+    return _KEY_POOL
+
+
+def http_get_json(url: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    pool = key_pool()
+    headers = {
+        "Accept": "application/json,*/*;q=0.8",
+        "User-Agent": "NFPC-NFTC-Auto-Review/1.0",
+    }
+    endpoint = {"endpoint": url.rsplit("/", 1)[-1].split(".")[0]}
+
+    attempt = 0
+    tries = 0
+    while attempt < MAX_RETRIES:
+        key = pool.acquire()
+        if key is None:
+            METRICS.inc("lawgo_key_pool_exhausted_total", endpoint)
+            raise KeyPoolExhausted(url)
+        if tries:
+            METRICS.inc("lawgo_request_retries_total", endpoint)
+        tries += 1
+
+        query = urllib.parse.urlencode({**params, "OC": key}, doseq=False, safe="")
+        req = urllib.request.Request(f"{url}?{query}", headers=headers, method="GET")
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            with urllib.request.urlopen(req, timeout=TIMEOUT) as resp:
+                body = resp.read().decode("utf-8", errors="replace")
+                if not body:
+                    raise ValueError("empty response")
+                payload = json.loads(body)
+                outcome = "ok"
+                return payload
+        except urllib.error.HTTPError as e:
+            if e.code in RATE_LIMIT_STATUS:
+                outcome = "rate_limited"
+                # 대체 키가 있으면 격리 후 즉시 재시도 (시도 횟수 미차감),
+                # 없으면 일반 실패처럼 같은 키로 backoff 후 재시도한다.
+                if pool.quarantine(key):
+                    continue
+        except Exception:
+            pass
+        finally:
+            METRICS.observe("lawgo_request_duration_seconds", time.perf_counter() - started, endpoint)
+            METRICS.inc("lawgo_requests_total", {**endpoint, "outcome": outcome})
+
+        attempt += 1
+        if attempt < MAX_RETRIES:
+            backoff(attempt)
+    return None
+
+
+def cache_key(url: str, params: Dict[str, Any]) -> str:
+    # OC는 키 풀에서 주입되므로 캐시 키에 포함되지 않는다.
+    return sha256_text(f"{url}?{urllib.parse.urlencode(sorted(params.items()))}")
+
+
+def cache_get(key: str, ttl: int) -> Optional[Any]:
+    store = state_store()
+    if store:
+        return store.cache_get(key, ttl)
+    path = os.path.join(CACHE_DIR, f"{key}.json")
+    try:
+        if time.time() - os.path.getmtime(path) > ttl:
+            return None
+    except OSError:
+        return None
+    return load_json(path, None)
+
+
+def cache_put(key: str, value: Any) -> None:
+    store = state_store()
+    if store:
+        store.cache_put(key, value)
+        return
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    path = os.path.join(CACHE_DIR, f"{key}.json")
+    tmp = f"{path}.{threading.get_ident()}.tmp"
+    save_json(tmp, value)
+    os.replace(tmp, path)
+
+
+def cached_get_json(url: str, params: Dict[str, Any], ttl: int) -> Optional[Dict[str, Any]]:
+    key = cache_key(url, params)
+    hit = cache_get(key, ttl)
+    METRICS.inc("lawgo_cache_requests_total", {"result": "hit" if hit is not None else "miss"})
+    if hit is not None:
+        return hit
+    payload = http_get_json(url, params)
+    if payload:
+        cache_put(key, payload)
+    return payload
+
+
+def to_list(obj: Any) -> List[Dict[str, Any]]:
+    if obj is None:
+        return []
+    if isinstance(obj, list):
+        return [x for x in obj if isinstance(x, dict)]
+    if isinstance(obj, dict):
+        return [obj]
+    return []
+
+
+def extract_items(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
+    candidates = []
+
+    adm = payload.get("AdmRulSearch") or payload.get("admrulSearch")
+    if isinstance(adm, dict):
+        candidates.extend(to_list(adm.get("admrul")))
+
+    # fallback patterns for schema variations
+    for key in ["admrul", "law", "items", "results"]:
+        candidates.extend(to_list(payload.get(key)))
+
+    # dedupe by serialized hash (raw digest: no hex encoding, half the set memory)
+    seen = set()
+    out = []
+    for item in candidates:
+        sig = hashlib.sha256(json.dumps(item, ensure_ascii=False, sort_keys=True).encode("utf-8")).digest()
+        if sig in seen:
+            continue
+        seen.add(sig)
+        out.append(item)
+    return out
+
+
+def pick_best_item(items: List[Dict[str, Any]], std: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    if not items:
+        return None
+
+    title = (std.get("title") or "").strip().lower()
+    org = (std.get("orgName") or "").strip().lower()
+
+    def score(x: Dict[str, Any]) -> int:
+        name = str(x.get("법령명한글") or x.get("법령명") or x.get("행정규칙명") or "").lower()
+        dept = str(x.get("소관부처") or x.get("소관부처명") or "").lower()
+        s = 0
+        if title and title in name:
+            s += 5
+        if org and org in dept:
+            s += 2
+        if x.get("현행연혁코드") == "현행":
+            s += 1
+        return s
+
+    # max() keeps the first of equal scores, same as a stable descending sort
+    return max(items, key=score)
+
+
+def build_snapshot_item(std: Dict[str, Any], api_item: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    if not api_item:
+        return {
+            "code": std.get("code"),
+            "title": std.get("title"),
+            "checkedAt": datetime.now(KST).isoformat(timespec="seconds"),
+            "status": "NOT_FOUND",
+            "noticeNo": "",
+            "announceDate": "",
+            "effectiveDate": "",
+            "revisionType": "",
+            "htmlUrl": "",
+            "ruleSerial": "",
+            "bodyHash": "",
+            "sourceHash": "",
+        }
+
+    source_hash = sha256_text(json.dumps(api_item, ensure_ascii=False, sort_keys=True))
+    html_url = api_item.get("법령상세링크") or api_item.get("상세링크") or ""
+
+    return {
+        "code": std.get("code"),
+        "title": std.get("title"),
+        "checkedAt": datetime.now(KST).isoformat(timespec="seconds"),
+        "status": "FOUND",
+        "noticeNo": str(api_item.get("공포번호") or api_item.get("발령번호") or ""),
+        "announceDate": normalize_date(api_item.get("공포일자") or api_item.get("발령일자") or ""),
+        "effectiveDate": normalize_date(api_item.get("시행일자") or ""),
+        "revisionType": str(api_item.get("제개정구분명") or api_item.get("제개정구분") or ""),
+        "htmlUrl": str(html_url),
+        "ruleSerial": str(api_item.get("행정규칙일련번호") or ""),
+        "bodyHash": source_hash,
+        "sourceHash": source_hash,
+    }
+
+
+def query_standard(std: Dict[str, Any]) -> Dict[str, Any]:
+    query = (std.get("query") or std.get("title") or "").strip()
+    if not query:
+        return build_snapshot_item(std, None)
+
+    # 국가법령정보센터 행정규칙 검색
+    params = {
+        "target": "admrul",
+        "type": "JSON",
+        "query": query,
+        "display": "20",
+    }
+
+    payload = http_get_json(LAW_SEARCH_URL, params)
+    if not payload:
+        return build_snapshot_item(std, None)
+
+    items = extract_items(payload)
+    best = pick_best_item(items, std)
+    return build_snapshot_item(std, best)
+
+
+def compare(prev: Optional[Dict[str, Any]], cur: Dict[str, Any]) -> bool:
+    if not prev:
+        return True
+    keys = ["status", "noticeNo", "announceDate", "effectiveDate", "revisionType", "bodyHash"]
+    return any((prev.get(k) or "") != (cur.get(k) or "") for k in keys)
+
+
+def process_scope(
+    scope_name: str,
+    standards_file: str,
+    prev_scope_snap: Dict[str, Any],
+    on_result: Optional[Callable[[str, Dict[str, Any], Optional[Dict[str, str]]], None]] = None,
+) -> Tuple[Dict[str, Any], List[Dict[str, str]]]:
+    standards = load_json(standards_file, {"items": []}).get("items", [])
+    new_scope_snap: Dict[str, Any] = {}
+    changes: List[Dict[str, str]] = []
+
+    skipped = 0
+    for std in standards:
+        code = std.get("code")
+        if not code:
+            continue
+
+        prev = prev_scope_snap.get(code)
+        try:
+            cur = query_standard(std)
+        except KeyPoolExhausted:
+            # 조회하지 못한 기준은 NOT_FOUND로 덮지 않고 이전 스냅샷을 유지한다.
+            skipped += 1
+            if prev:
+                new_scope_snap[code] = prev
+            continue
+        change = None
+        if compare(prev, cur):
+            change = {
+                "scope": scope_name,
+                "code": code,
+                "title": std.get("title", ""),
+                "status": cur.get("status", ""),
+            }
+            changes.append(change)
+        new_scope_snap[code] = cur
+        if on_result:
+            on_result(scope_name, cur, change)
+
+    if skipped:
+        METRICS.inc("nfpc_standards_skipped_total", {"scope": scope_name}, skipped)
+        print(f"{scope_name}: 사용 가능한 OC 키가 없어 {skipped}건 건너뜀 (이전 스냅샷 유지)")
+    return new_scope_snap, changes
+
+
+def append_history(history: Dict[str, Any], scope_key: str, new_scope_snap: Dict[str, Any], changes: List[Dict[str, str]]) -> None:
+    scope_hist = history.setdefault(scope_key, {})
+    for ch in changes:
+        cur = new_scope_snap.get(ch["code"])
+        if not cur or cur.get("status") != "FOUND":
+            continue
+        versions = scope_hist.setdefault(ch["code"], [])
+        if versions and not compare(versions[-1], cur):
+            continue
+        versions.append(cur)
+
+
+def build_effective_index(snapshot: Dict[str, Any], history: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """현재·과거 스냅샷의 시행일을 date 기준으로 정렬한 인덱스를 만든다."""
+    seen = set()
+    index: List[Dict[str, Any]] = []
+
+    def add(scope_key: str, item: Dict[str, Any]) -> None:
+        eff = parse_date(item.get("effectiveDate"))
+        if not eff:
+            return
+        sig = (scope_key, item.get("code"), eff, item.get("noticeNo") or "")
+        if sig in seen:
+            return
+        seen.add(sig)
+        ann = parse_date(item.get("announceDate"))
+        index.append({
+            "scope": scope_key.upper(),
+            "code": item.get("code"),
+            "title": item.get("title") or "",
+            "effectiveDate": eff,
+            "announceDate": ann,
+            "noticeNo": item.get("noticeNo") or "",
+            "revisionType": item.get("revisionType") or "",
+            "htmlUrl": item.get("htmlUrl") or "",
+        })
+
+    for scope_key in ("nfpc", "nftc"):
+        for item in (snapshot.get(scope_key) or {}).values():
+            add(scope_key, item)
+        for versions in (history.get(scope_key) or {}).values():
+            for item in versions:
+                add(scope_key, item)
+
+    index.sort(key=lambda x: (x["effectiveDate"], x["scope"], x["code"] or ""))
+    return index
+
+
+def query_effective(index: List[Dict[str, Any]], start: date, end: date) -> List[Dict[str, Any]]:
+    """start 이상 end 이하 시행일 항목 (index는 build_effective_index 결과)."""
+    lo = bisect.bisect_left(index, start, key=lambda x: x["effectiveDate"])
+    hi = bisect.bisect_right(index, end, key=lambda x: x["effectiveDate"])
+    return index[lo:hi]
+
+
+def build_upcoming(index: List[Dict[str, Any]], start: date, days: int) -> Dict[str, Any]:
+    items = []
+    for x in query_effective(index, start, start + timedelta(days=days)):
+        items.append({
+            **x,
+            "effectiveDate": x["effectiveDate"].isoformat(),
+            "announceDate": x["announceDate"].isoformat() if x["announceDate"] else "",
+            "daysLeft": (x["effectiveDate"] - start).days,
+        })
+    return {
+        "generatedAt": datetime.now(KST).isoformat(timespec="seconds"),
+        "from": start.isoformat(),
+        "days": days,
+        "items": items,
+    }
+
+
+def normalize_title(v: Any) -> str:
+    return "".join(str(v or "").split()).lower()
+
+
+def fetch_revision_history(std: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+    """행정규칙 연혁(nw=2) 검색으로 기준의 과거 발령본을 발령일 순으로 돌려준다. 조회 실패 시 None."""
+    query = (std.get("query") or std.get("title") or "").strip()
+    if not query:
+        return []
+
+    title = normalize_title(std.get("title") or query)
+    items: List[Dict[str, Any]] = []
+    for page in range(1, BACKFILL_MAX_PAGES + 1):
+        params = {
+            "target": "admrul",
+            "type": "JSON",
+            "query": query,
+            "nw": "2",
+            "display": str(BACKFILL_DISPLAY),
+            "page": str(page),
+        }
+        try:
+            payload = cached_get_json(LAW_SEARCH_URL, params, BACKFILL_CACHE_TTL)
+        except KeyPoolExhausted:
+            return None
+        if not payload:
+            return None
+        page_items = extract_items(payload)
+        items.extend(page_items)
+        if len(page_items) < BACKFILL_DISPLAY:
+            break
+
+    versions: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+    for item in items:
+        name = item.get("행정규칙명") or item.get("법령명한글") or item.get("법령명") or ""
+        if normalize_title(name) != title:
+            continue
+        snap = build_snapshot_item(std, item)
+        versions.setdefault((snap["noticeNo"], snap["announceDate"], snap["effectiveDate"]), snap)
+
+    return sorted(versions.values(), key=lambda x: (parse_date(x["announceDate"]) or date.min, x["noticeNo"]))
+
+
+def merge_history(existing: List[Dict[str, Any]], backfilled: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    merged: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+    for item in backfilled + existing:
+        merged[(item.get("noticeNo") or "", item.get("announceDate") or "", item.get("effectiveDate") or "")] = item
+    return sorted(merged.values(), key=lambda x: (parse_date(x.get("announceDate")) or date.min, x.get("noticeNo") or ""))
+
+
+def backfill(scopes: List[Tuple[str, str]], workers: int) -> Tuple[Dict[str, Any], int, List[str]]:
+    """모든 기준의 연혁을 병렬 조회해 history.json에 한 번에 병합한다.
+
+    조회 결과는 CACHE_DIR에 남으므로 중단 후 다시 실행하면 받지 못한 페이지만 요청한다.
+    """
+    _, _, history = load_state(state_store())
+    jobs = []
+    for scope_key, standards_file in scopes:
+        for std in load_json(standards_file, {"items": []}).get("items", []):
+            if std.get("code"):
+                jobs.append((scope_key, std))
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as ex:
+        results = list(ex.map(lambda job: fetch_revision_history(job[1]), jobs))
+
+    added = 0
+    failed: List[str] = []
+    for (scope_key, std), versions in zip(jobs, results):
+        if versions is None:
+            failed.append(std["code"])
+            continue
+        scope_hist = history.setdefault(scope_key, {})
+        before = len(scope_hist.get(std["code"], []))
+        merged = merge_history(scope_hist.get(std["code"], []), versions)
+        if merged:
+            scope_hist[std["code"]] = merged
+        added += len(merged) - before
+
+    return history, added, failed
+
+
+def list_attachments(rule_serial: str) -> Optional[List[Dict[str, str]]]:
+    """행정규칙 본문 조회 결과에서 별표·서식·첨부파일 링크를 모은다. 조회 실패 시 None."""
+    try:
+        payload = http_get_json(LAW_SERVICE_URL, {"target": "admrul", "ID": rule_serial, "type": "JSON"})
+    except KeyPoolExhausted:
+        return None
+    if not payload:
+        return None
+
+    found: Dict[str, Dict[str, str]] = {}
+
+    def add(link: Any, name: Any) -> None:
+        link = str(link or "").strip()
+        if not link:
+            return
+        url = link if link.startswith("http") else urllib.parse.urljoin(LAW_BASE_URL, link)
+        found.setdefault(url, {"name": str(name or "").strip() or url.rsplit("/", 1)[-1], "url": url})
+
+    def walk(node: Any) -> None:
+        if isinstance(node, list):
+            for x in node:
+                walk(x)
+            return
+        if not isinstance(node, dict):
+            return
+        name = node.get("별표제목") or node.get("서식제목") or node.get("첨부파일명")
+        for k, v in node.items():
+            if not k.endswith("파일링크"):
+                walk(v)
+            elif isinstance(v, list):
+                # 첨부파일은 링크·파일명이 같은 순서의 병렬 리스트로 내려온다.
+                names = name if isinstance(name, list) else [name] * len(v)
+                for link, nm in zip(v, names):
+                    add(link, nm)
+            else:
+                add(v, name)
+
+    walk(payload)
+    return list(found.values())
+
+
+def download_attachment(url: str) -> Optional[Dict[str, Any]]:
+    """스트리밍으로 받아 sha256을 계산하고, 같은 내용이 이미 있으면 새로 저장하지 않는다."""
+    blob_dir = os.path.join(ATTACHMENT_DIR, "blobs")
+    os.makedirs(blob_dir, exist_ok=True)
+    headers = {"User-Agent": "NFPC-NFTC-Auto-Review/1.0"}
+
+    for attempt in range(1, MAX_RETRIES + 1):
+        tmp = os.path.join(blob_dir, f".{threading.get_ident()}.{attempt}.part")
+        try:
+            digest = hashlib.sha256()
+            size = 0
+            req = urllib.request.Request(url, headers=headers, method="GET")
+            with urllib.request.urlopen(req, timeout=TIMEOUT) as resp, open(tmp, "wb") as f:
+                while True:
+                    chunk = resp.read(ATTACHMENT_CHUNK)
+                    if not chunk:
+                        break
+                    digest.update(chunk)
+                    size += len(chunk)
+                    f.write(chunk)
+            sha = digest.hexdigest()
+            path = os.path.join(blob_dir, sha)
+            if os.path.exists(path):
+                os.remove(tmp)
+            else:
+                os.replace(tmp, path)
+            return {"sha256": sha, "size": size}
+        except Exception:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            if attempt == MAX_RETRIES:
+                return None
+            backoff(attempt)
+    return None
+
+
+def fetch_attachments(changed: List[Tuple[str, Dict[str, Any]]], manifest: Dict[str, Any]) -> int:
+    """변경된 기준의 첨부를 병렬로 내려받아 manifest에 버전별로 기록한다. 새로 저장된 blob 수를 돌려준다."""
+    targets = [(scope_key, cur) for scope_key, cur in changed if cur.get("status") == "FOUND" and cur.get("ruleSerial")]
+    if not targets:
+        return 0
+
+    with ThreadPoolExecutor(max_workers=max(1, ATTACHMENT_WORKERS)) as ex:
+        listings = list(ex.map(lambda t: list_attachments(t[1]["ruleSerial"]), targets))
+        urls = list(dict.fromkeys(a["url"] for files in listings if files for a in files))
+        downloaded = dict(zip(urls, ex.map(download_attachment, urls)))
+    for got in downloaded.values():
+        METRICS.inc("nfpc_attachment_downloads_total", {"result": "ok" if got else "error"})
+
+    blobs = manifest.setdefault("blobs", {})
+    new_blobs = 0
+    for (scope_key, cur), files in zip(targets, listings):
+        if files is None:
+            continue
+        entry = {
+            "noticeNo": cur.get("noticeNo", ""),
+            "announceDate": cur.get("announceDate", ""),
+            "fetchedAt": datetime.now(KST).isoformat(timespec="seconds"),
+            "files": [],
+        }
+        for a in files:
+            got = downloaded.get(a["url"])
+            if not got:
+                entry["files"].append({**a, "sha256": "", "size": 0})
+                continue
+            if got["sha256"] not in blobs:
+                blobs[got["sha256"]] = {"size": got["size"], "firstSeen": TODAY}
+                new_blobs += 1
+            entry["files"].append({**a, **got})
+
+        versions = manifest.setdefault(scope_key, {}).setdefault(cur["code"], [])
+        if versions and (versions[-1]["noticeNo"], versions[-1]["announceDate"]) == (entry["noticeNo"], entry["announceDate"]):
+            versions[-1] = entry
+        else:
+            versions.append(entry)
+    return new_blobs
+
+
+def build_notifications(changes: List[Dict[str, str]], snapshot: Dict[str, Any]) -> List[Dict[str, Any]]:
+    out: Dict[str, Dict[str, Any]] = {}
+    for ch in changes:
+        cur = (snapshot.get(ch["scope"].lower()) or {}).get(ch["code"]) or {}
+        fields = ["status", "noticeNo", "announceDate", "effectiveDate", "revisionType", "bodyHash"]
+        nid = sha256_text("|".join([ch["scope"], ch["code"]] + [str(cur.get(k) or "") for k in fields]))[:16]
+        out[nid] = {
+            "id": nid,
+            "scope": ch["scope"],
+            "code": ch["code"],
+            "title": ch.get("title", ""),
+            "status": cur.get("status", ch.get("status", "")),
+            "noticeNo": cur.get("noticeNo", ""),
+            "announceDate": cur.get("announceDate", ""),
+            "effectiveDate": cur.get("effectiveDate", ""),
+            "revisionType": cur.get("revisionType", ""),
+            "htmlUrl": cur.get("htmlUrl", ""),
+        }
+    return list(out.values())
+
+
+def format_notification_text(batch: List[Dict[str, Any]]) -> str:
+    lines = [f"[NFPC/NFTC] {TODAY} 변경 {len(batch)}건"]
+    for n in batch:
+        lines.append(f"- {n['code']} {n['title']} · 시행 {n['effectiveDate'] or '-'} · {n['revisionType'] or n['status']}")
+        if n["htmlUrl"]:
+            lines.append(f"  {n['htmlUrl']}")
+    return "\n".join(lines)
+
+
+class WebhookSink:
+    def __init__(self, url: str):
+        self.url = url
+        self.name = f"webhook:{sha256_text(url)[:8]}"
+
+    def send(self, batch: List[Dict[str, Any]]) -> None:
+        body = json.dumps({"text": format_notification_text(batch), "changes": batch}, ensure_ascii=False).encode("utf-8")
+        req = urllib.request.Request(self.url, data=body, method="POST", headers={
+            "Content-Type": "application/json; charset=utf-8",
+            "User-Agent": "NFPC-NFTC-Auto-Review/1.0",
+        })
+        with urllib.request.urlopen(req, timeout=TIMEOUT) as resp:
+            resp.read()
+
+
+class EmailSink:
+    def __init__(self, host: str, port: int, sender: str, recipients: List[str], user: str = "", password: str = ""):
+        self.host = host
+        self.port = port
+        self.sender = sender
+        self.recipients = recipients
+        self.user = user
+        self.password = password
+        self.name = f"email:{sha256_text(','.join(sorted(recipients)))[:8]}"
+
+    def send(self, batch: List[Dict[str, Any]]) -> None:
+        msg = EmailMessage()
+        msg["Subject"] = f"[NFPC/NFTC] {TODAY} 기준 변경 {len(batch)}건"
+        msg["From"] = self.sender
+        msg["To"] = ", ".join(self.recipients)
+        msg.set_content(format_notification_text(batch))
+        with smtplib.SMTP(self.host, self.port, timeout=TIMEOUT) as smtp:
+            if self.user:
+                smtp.starttls()
+                smtp.login(self.user, self.password)
+            smtp.send_message(msg)
+
+
+class FileDropSink:
+    """로컬/테스트용: 배치를 디렉터리에 JSON 파일로 떨군다."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.name = f"file:{directory}"
+
+    def send(self, batch: List[Dict[str, Any]]) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        stamp = datetime.now(KST).strftime("%Y%m%dT%H%M%S")
+        path = os.path.join(self.directory, f"notify-{stamp}-{sha256_text(','.join(n['id'] for n in batch))[:8]}.json")
+        tmp = path + ".tmp"
+        save_json(tmp, {"date": TODAY, "changes": batch})
+        os.replace(tmp, path)
+
+
+def notify_sinks_from_env() -> List[Any]:
+    sinks: List[Any] = []
+    for url in os.getenv("NOTIFY_WEBHOOK_URL", "").split(","):
+        if url.strip():
+            sinks.append(WebhookSink(url.strip()))
+
+    host = os.getenv("NOTIFY_SMTP_HOST", "").strip()
+    recipients = [x.strip() for x in os.getenv("NOTIFY_EMAIL_TO", "").split(",") if x.strip()]
+    if host and recipients:
+        sinks.append(EmailSink(
+            host,
+            int(os.getenv("NOTIFY_SMTP_PORT", "587")),
+            os.getenv("NOTIFY_EMAIL_FROM", "").strip() or recipients[0],
+            recipients,
+            os.getenv("NOTIFY_SMTP_USER", "").strip(),
+            os.getenv("NOTIFY_SMTP_PASSWORD", ""),
+        ))
+
+    drop_dir = os.getenv("NOTIFY_DIR", "").strip()
+    if drop_dir:
+        sinks.append(FileDropSink(drop_dir))
+    return sinks
+
+
+class Notifier:
+    """싱크별 백그라운드 스레드로 배치 전송. 이미 보낸 변경 id는 싱크별로 건너뛴다."""
+
+    def __init__(self, sinks: List[Any], state: Dict[str, Any]):
+        self.sinks = sinks
+        self._lock = threading.Lock()
+        self._sent: Dict[str, Dict[str, str]] = {k: dict(v) for k, v in (state.get("sent") or {}).items()}
+        self._threads: List[threading.Thread] = []
+
+    def submit(self, notifications: List[Dict[str, Any]]) -> None:
+        for sink in self.sinks:
+            with self._lock:
+                sent = self._sent.get(sink.name, {})
+                batch = [n for n in notifications if n["id"] not in sent]
+            if not batch:
+                continue
+            t = threading.Thread(target=self._deliver, args=(sink, batch), name=sink.name, daemon=True)
+            t.start()
+            self._threads.append(t)
+
+    def _deliver(self, sink: Any, batch: List[Dict[str, Any]]) -> None:
+        for attempt in range(1, NOTIFY_MAX_RETRIES + 1):
+            try:
+                sink.send(batch)
+            except Exception as e:
+                if attempt == NOTIFY_MAX_RETRIES:
+                    print(f"notify {sink.name} failed: {e}")
+                    return
+                backoff(attempt)
+                continue
+            with self._lock:
+                sent = self._sent.setdefault(sink.name, {})
+                for n in batch:
+                    sent[n["id"]] = TODAY
+            return
+
+    def join(self, timeout: float = NOTIFY_JOIN_TIMEOUT) -> Dict[str, Any]:
+        deadline = time.time() + timeout
+        for t in self._threads:
+            t.join(max(0.0, deadline - time.time()))
+
+        cutoff = (datetime.now(KST) - timedelta(days=NOTIFY_KEEP_DAYS)).strftime("%Y-%m-%d")
+        with self._lock:
+            return {"sent": {
+                name: {nid: d for nid, d in sent.items() if d >= cutoff}
+                for name, sent in self._sent.items()
+            }}
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS catalog (
+    scope TEXT NOT NULL,
+    code TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    title TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (scope, code)
+);
+CREATE TABLE IF NOT EXISTS snapshots (
+    scope TEXT NOT NULL,
+    code TEXT NOT NULL,
+    status TEXT,
+    notice_no TEXT,
+    announce_date TEXT,
+    effective_date TEXT,
+    checked_at TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (scope, code)
+);
+CREATE INDEX IF NOT EXISTS idx_snapshots_effective ON snapshots (effective_date);
+CREATE TABLE IF NOT EXISTS history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    scope TEXT NOT NULL,
+    code TEXT NOT NULL,
+    notice_no TEXT NOT NULL,
+    announce_date TEXT NOT NULL,
+    effective_date TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_history_code ON history (scope, code, id);
+CREATE INDEX IF NOT EXISTS idx_history_effective ON history (effective_date);
+CREATE TABLE IF NOT EXISTS runs (
+    date TEXT PRIMARY KEY,
+    scope TEXT,
+    result TEXT,
+    summary TEXT
+);
+CREATE TABLE IF NOT EXISTS change_events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_date TEXT NOT NULL,
+    scope TEXT NOT NULL,
+    code TEXT NOT NULL,
+    title TEXT,
+    status TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_change_events_code ON change_events (code, run_date);
+CREATE INDEX IF NOT EXISTS idx_change_events_date ON change_events (run_date);
+CREATE TABLE IF NOT EXISTS fetch_cache (
+    key TEXT PRIMARY KEY,
+    fetched_at REAL NOT NULL,
+    body TEXT NOT NULL
+);
+"""
+
+
+def iso_or_empty(v: Any) -> str:
+    d = parse_date(v)
+    return d.isoformat() if d else ""
+
+
+class SqliteStore:
+    """snapshot/data/history/standards JSON 대신 쓰는 SQLite(WAL) 상태 저장소.
+
+    기준 목록은 계속 standards_*.json에서 편집하고 실행마다 catalog로 동기화한다.
+    대시보드용 JSON은 export_json()으로 다시 만든다.
+    """
+
+    def __init__(self, path: str):
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+    def _tx(self, fn: Callable[[sqlite3.Connection], Any]) -> Any:
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                out = fn(self.conn)
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+            self.conn.execute("COMMIT")
+            return out
+
+    def _rows(self, sql: str, args: Tuple[Any, ...] = ()) -> List[Tuple[Any, ...]]:
+        with self._lock:
+            return self.conn.execute(sql, args).fetchall()
+
+    def is_empty(self) -> bool:
+        return not self._rows("SELECT 1 FROM catalog LIMIT 1") and not self._rows("SELECT 1 FROM runs LIMIT 1")
+
+    def sync_catalog(self, scope_key: str, items: List[Dict[str, Any]]) -> None:
+        def run(c: sqlite3.Connection) -> None:
+            c.execute("DELETE FROM catalog WHERE scope = ?", (scope_key,))
+            c.executemany(
+                "INSERT OR REPLACE INTO catalog (scope, code, position, title, data) VALUES (?, ?, ?, ?, ?)",
+                [(scope_key, x["code"], i, x.get("title", ""), json.dumps(x, ensure_ascii=False))
+                 for i, x in enumerate(items) if x.get("code")],
+            )
+            # JSON 경로처럼 목록에서 빠진 기준은 snapshot에서도 제외한다 (이력은 유지).
+            c.execute(
+                "DELETE FROM snapshots WHERE scope = ? AND code NOT IN (SELECT code FROM catalog WHERE scope = ?)",
+                (scope_key, scope_key),
+            )
+        self._tx(run)
+
+    def _put_snapshot(self, c: sqlite3.Connection, scope_key: str, cur: Dict[str, Any]) -> None:
+        c.execute(
+            "INSERT OR REPLACE INTO snapshots (scope, code, status, notice_no, announce_date, effective_date, checked_at, data) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (scope_key, cur["code"], cur.get("status", ""), cur.get("noticeNo", ""), iso_or_empty(cur.get("announceDate")),
+             iso_or_empty(cur.get("effectiveDate")), cur.get("checkedAt", ""), json.dumps(cur, ensure_ascii=False)),
+        )
+
+    def _put_history(self, c: sqlite3.Connection, scope_key: str, item: Dict[str, Any]) -> None:
+        c.execute(
+            "INSERT INTO history (scope, code, notice_no, announce_date, effective_date, data) VALUES (?, ?, ?, ?, ?, ?)",
+            (scope_key, item["code"], item.get("noticeNo") or "", iso_or_empty(item.get("announceDate")),
+             iso_or_empty(item.get("effectiveDate")), json.dumps(item, ensure_ascii=False)),
+        )
+
+    def begin_run(self, run_date: str) -> List[Dict[str, str]]:
+        """오늘 실행을 시작하고, 중단된 실행이 남긴(아직 runs에 확정되지 않은) 변경을 돌려준다.
+
+        완료된 실행이 있으면 data.json과 같게 그날 기록을 비우고 새로 시작한다.
+        중단된 실행의 기준은 스냅샷이 이미 갱신돼 재실행에서 다시 감지되지 않으므로
+        이벤트를 지우지 않고 pending으로 넘겨 이번 실행 결과에 합친다.
+        """
+        def run(c: sqlite3.Connection) -> List[Dict[str, str]]:
+            if c.execute("SELECT 1 FROM runs WHERE date = ?", (run_date,)).fetchone():
+                c.execute("DELETE FROM change_events WHERE run_date = ?", (run_date,))
+                c.execute("DELETE FROM runs WHERE date = ?", (run_date,))
+                return []
+            rows = c.execute(
+                "SELECT scope, code, title, status FROM change_events WHERE run_date = ? ORDER BY id", (run_date,)
+            ).fetchall()
+            return [{"scope": sc, "code": code, "title": title, "status": st} for sc, code, title, st in rows]
+        return self._tx(run)
+
+    def upsert_standard(self, scope_name: str, cur: Dict[str, Any], change: Optional[Dict[str, str]]) -> None:
+        """기준 하나의 스냅샷·이력·변경 이벤트를 한 트랜잭션으로 반영한다."""
+        scope_key = scope_name.lower()
+
+        def run(c: sqlite3.Connection) -> None:
+            self._put_snapshot(c, scope_key, cur)
+            if change:
+                # pending 이벤트가 있던 기준이 다시 바뀌면 최신 이벤트 하나만 남긴다.
+                c.execute(
+                    "DELETE FROM change_events WHERE run_date = ? AND scope = ? AND code = ?",
+                    (TODAY, change["scope"], change["code"]),
+                )
+                c.execute(
+                    "INSERT INTO change_events (run_date, scope, code, title, status) VALUES (?, ?, ?, ?, ?)",
+                    (TODAY, change["scope"], change["code"], change.get("title", ""), change.get("status", "")),
+                )
+                if cur.get("status") == "FOUND":
+                    # append_history와 동일: 직전 버전과 같으면 추가하지 않는다.
+                    last = c.execute(
+                        "SELECT data FROM history WHERE scope = ? AND code = ? ORDER BY id DESC LIMIT 1",
+                        (scope_key, cur["code"]),
+                    ).fetchone()
+                    if not last or compare(json.loads(last[0]), cur):
+                        self._put_history(c, scope_key, cur)
+        self._tx(run)
+
+    def save_run(self, record: Dict[str, Any], last_run: str) -> None:
+        def run(c: sqlite3.Connection) -> None:
+            c.execute(
+                "INSERT OR REPLACE INTO runs (date, scope, result, summary) VALUES (?, ?, ?, ?)",
+                (record["date"], record.get("scope", ""), record.get("result", ""), record.get("summary", "")),
+            )
+            c.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('lastRun', ?)", (last_run,))
+        self._tx(run)
+
+    def save_history(self, history: Dict[str, Any]) -> None:
+        """기준별 이력 목록을 통째로 교체한다 (backfill 병합 결과 반영용)."""
+        def run(c: sqlite3.Connection) -> None:
+            for scope_key, by_code in history.items():
+                for code, versions in by_code.items():
+                    c.execute("DELETE FROM history WHERE scope = ? AND code = ?", (scope_key, code))
+                    for item in versions:
+                        self._put_history(c, scope_key, item)
+        self._tx(run)
+
+    def load_catalog(self, scope_key: str) -> Dict[str, Any]:
+        rows = self._rows("SELECT data FROM catalog WHERE scope = ? ORDER BY position", (scope_key,))
+        return {"items": [json.loads(r[0]) for r in rows]}
+
+    def load_snapshot(self) -> Dict[str, Any]:
+        out: Dict[str, Any] = {"nfpc": {}, "nftc": {}}
+        for scope_key, code, data in self._rows("SELECT scope, code, data FROM snapshots ORDER BY rowid"):
+            out.setdefault(scope_key, {})[code] = json.loads(data)
+        return out
+
+    def load_history(self) -> Dict[str, Any]:
+        out: Dict[str, Any] = {"nfpc": {}, "nftc": {}}
+        rows = self._rows("SELECT scope, code, data FROM history ORDER BY id")
+        for scope_key, code, data in rows:
+            out.setdefault(scope_key, {}).setdefault(code, []).append(json.loads(data))
+        return out
+
+    def load_data(self, limit: int = 365) -> Dict[str, Any]:
+        last = self._rows("SELECT value FROM meta WHERE key = 'lastRun'")
+        runs = self._rows("SELECT date, scope, result, summary FROM runs ORDER BY date DESC LIMIT ?", (limit,))
+        events: Dict[str, List[Dict[str, str]]] = {}
+        if runs:
+            rows = self._rows(
+                "SELECT run_date, scope, code, title, status FROM change_events WHERE run_date >= ? ORDER BY id",
+                (runs[-1][0],),
+            )
+            for run_date, scope, code, title, status in rows:
+                events.setdefault(run_date, []).append({"scope": scope, "code": code, "title": title, "status": status})
+        return {
+            "lastRun": last[0][0] if last else None,
+            "records": [
+                {"date": d, "scope": sc, "result": res, "summary": summ, "changes": events.get(d, [])}
+                for d, sc, res, summ in runs
+            ],
+        }
+
+    def changes_for(self, code: str) -> List[Dict[str, str]]:
+        rows = self._rows("SELECT run_date, scope, title, status FROM change_events WHERE code = ? ORDER BY run_date DESC", (code,))
+        return [{"date": d, "scope": sc, "code": code, "title": t, "status": st} for d, sc, t, st in rows]
+
+    def effective_between(self, start: date, end: date) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """시행일 인덱스로 범위 안의 스냅샷·이력만 읽어 load_state와 같은 모양으로 돌려준다."""
+        args = (start.isoformat(), end.isoformat())
+        snapshot: Dict[str, Any] = {"nfpc": {}, "nftc": {}}
+        for scope_key, code, data in self._rows(
+            "SELECT scope, code, data FROM snapshots WHERE effective_date BETWEEN ? AND ? ORDER BY rowid", args
+        ):
+            snapshot.setdefault(scope_key, {})[code] = json.loads(data)
+        history: Dict[str, Any] = {"nfpc": {}, "nftc": {}}
+        for scope_key, code, data in self._rows(
+            "SELECT scope, code, data FROM history WHERE effective_date BETWEEN ? AND ? ORDER BY id", args
+        ):
+            history.setdefault(scope_key, {}).setdefault(code, []).append(json.loads(data))
+        return snapshot, history
+
+    def cache_get(self, key: str, ttl: int) -> Optional[Any]:
+        rows = self._rows("SELECT fetched_at, body FROM fetch_cache WHERE key = ?", (key,))
+        if not rows or time.time() - rows[0][0] > ttl:
+            return None
+        return json.loads(rows[0][1])
+
+    def cache_put(self, key: str, value: Any) -> None:
+        self._tx(lambda c: c.execute(
+            "INSERT OR REPLACE INTO fetch_cache (key, fetched_at, body) VALUES (?, ?, ?)",
+            (key, time.time(), json.dumps(value, ensure_ascii=False)),
+        ))
+
+    def import_json(self) -> None:
+        """기존 JSON 파일 상태를 그대로 DB에 옮긴다 (최초 전환용)."""
+        for scope_key in ("nfpc", "nftc"):
+            self.sync_catalog(scope_key, load_json(f"standards_{scope_key}.json", {"items": []}).get("items", []))
+
+        snapshot = load_json("snapshot.json", {"nfpc": {}, "nftc": {}})
+        data = load_json("data.json", {"lastRun": None, "records": []})
+
+        def run(c: sqlite3.Connection) -> None:
+            for scope_key, by_code in snapshot.items():
+                for item in by_code.values():
+                    self._put_snapshot(c, scope_key, item)
+            for rec in reversed(data.get("records", [])):
+                c.execute(
+                    "INSERT OR REPLACE INTO runs (date, scope, result, summary) VALUES (?, ?, ?, ?)",
+                    (rec["date"], rec.get("scope", ""), rec.get("result", ""), rec.get("summary", "")),
+                )
+                c.execute("DELETE FROM change_events WHERE run_date = ?", (rec["date"],))
+                c.executemany(
+                    "INSERT INTO change_events (run_date, scope, code, title, status) VALUES (?, ?, ?, ?, ?)",
+                    [(rec["date"], ch.get("scope", ""), ch.get("code", ""), ch.get("title", ""), ch.get("status", ""))
+                     for ch in rec.get("changes", [])],
+                )
+            if data.get("lastRun"):
+                c.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('lastRun', ?)", (data["lastRun"],))
+        self._tx(run)
+        self.save_history(load_json(HISTORY_FILE, {"nfpc": {}, "nftc": {}}))
+
+    def export_json(self) -> None:
+        """app.js가 읽는 JSON 파일들을 DB 내용으로 다시 쓴다."""
+        for scope_key in ("nfpc", "nftc"):
+            save_json(f"standards_{scope_key}.json", self.load_catalog(scope_key))
+        save_json("data.json", self.load_data())
+        save_json("snapshot.json", self.load_snapshot())
+        save_json(HISTORY_FILE, self.load_history())
+
+
+_STATE_STORE: Optional[SqliteStore] = None
+
+
+def state_store() -> Optional[SqliteStore]:
+    global _STATE_STORE
+    if STATE_BACKEND != "sqlite":
+        return None
+    if _STATE_STORE is None:
+        store = SqliteStore(STATE_DB)
+        if store.is_empty():
+            store.import_json()
+        _STATE_STORE = store
+    return _STATE_STORE
+
+
+def load_state(store: Optional[SqliteStore]) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+    if store:
+        return store.load_data(), store.load_snapshot(), store.load_history()
+    return (
+        load_json("data.json", {"lastRun": None, "records": []}),
+        load_json("snapshot.json", {"nfpc": {}, "nftc": {}}),
+        load_json(HISTORY_FILE, {"nfpc": {}, "nftc": {}}),
+    )
+
+
+def record_run_metrics(scopes: Dict[str, Tuple[Dict[str, Any], List[Dict[str, str]]]], started: float) -> None:
+    for scope_name, (scope_snap, changes) in scopes.items():
+        labels = {"scope": scope_name}
+        METRICS.set("nfpc_standards_checked", len(scope_snap), labels)
+        METRICS.set("nfpc_not_found", sum(1 for x in scope_snap.values() if x.get("status") == "NOT_FOUND"), labels)
+        METRICS.set("nfpc_changes", len(changes), labels)
+    METRICS.set("nfpc_run_duration_seconds", time.perf_counter() - started)
+    METRICS.set("nfpc_last_run_timestamp_seconds", time.time())
+
+
+def merge_pending(pending: List[Dict[str, str]], scope_name: str, new_scope_snap: Dict[str, Any], changes: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    """중단된 실행에서 이미 확정된 변경을 이번 실행 변경 목록 앞에 합친다."""
+    seen = {ch["code"] for ch in changes}
+    carried = [p for p in pending if p["scope"] == scope_name and p["code"] in new_scope_snap and p["code"] not in seen]
+    return carried + changes
+
+
+def main() -> None:
+    started = time.perf_counter()
+    pool = key_pool()
+    store = state_store()
+    on_result = None
+    pending: List[Dict[str, str]] = []
+    if store:
+        for scope_key in ("nfpc", "nftc"):
+            store.sync_catalog(scope_key, load_json(f"standards_{scope_key}.json", {"items": []}).get("items", []))
+        pending = store.begin_run(TODAY)
+        on_result = store.upsert_standard
+    data, snapshot, history = load_state(store)
+
+    nfpc_new, nfpc_changes = process_scope("NFPC", "standards_nfpc.json", snapshot.get("nfpc", {}), on_result)
+    nftc_new, nftc_changes = process_scope("NFTC", "standards_nftc.json", snapshot.get("nftc", {}), on_result)
+    if pending:
+        nfpc_changes = merge_pending(pending, "NFPC", nfpc_new, nfpc_changes)
+        nftc_changes = merge_pending(pending, "NFTC", nftc_new, nftc_changes)
+
+    all_changes = nfpc_changes + nftc_changes
+
+    if ATTACHMENTS_ENABLED:
+        manifest = load_json(ATTACHMENT_MANIFEST, {"blobs": {}, "nfpc": {}, "nftc": {}})
+        changed = [(ch["scope"].lower(), (nfpc_new if ch["scope"] == "NFPC" else nftc_new)[ch["code"]]) for ch in all_changes]
+        new_blobs = fetch_attachments(changed, manifest)
+        save_json(ATTACHMENT_MANIFEST, manifest)
+        print(f"첨부 신규 {new_blobs}건")
+
+    notifier = Notifier(notify_sinks_from_env(), load_json(NOTIFY_STATE_FILE, {}))
+    notifier.submit(build_notifications(all_changes, {"nfpc": nfpc_new, "nftc": nftc_new}))
+
+    result = "변경 있음" if all_changes else "변경 없음"
+    summary = f"NFPC 변경 {len(nfpc_changes)}건 / NFTC 변경 {len(nftc_changes)}건"
+
+    record = {
+        "date": TODAY,
+        "scope": "NFPC/NFTC",
+        "result": result,
+        "summary": summary,
+        "changes": all_changes,
+    }
+
+    records = data.get("records", [])
+    if records and records[0].get("date") == TODAY:
+        records[0] = record
+    else:
+        records.insert(0, record)
+
+    data["lastRun"] = datetime.now(KST).isoformat(timespec="seconds")
+    data["records"] = records[:365]
+
+    snapshot["nfpc"] = nfpc_new
+    snapshot["nftc"] = nftc_new
+    append_history(history, "nfpc", nfpc_new, nfpc_changes)
+    append_history(history, "nftc", nftc_new, nftc_changes)
+
+    index = build_effective_index(snapshot, history)
+    today = datetime.now(KST).date()
+
+    if store:
+        store.save_run(record, data["lastRun"])
+        store.export_json()
+    else:
+        save_json("data.json", data)
+        save_json("snapshot.json", snapshot)
+        save_json(HISTORY_FILE, history)
+    save_json(UPCOMING_FILE, build_upcoming(index, today, UPCOMING_DAYS))
+    save_json(KEY_STATE_FILE, pool.state())
+
+    if notifier.sinks:
+        save_json(NOTIFY_STATE_FILE, notifier.join())
+
+    record_run_metrics({"NFPC": (nfpc_new, nfpc_changes), "NFTC": (nftc_new, nftc_changes)}, started)
+    if METRICS_TEXTFILE:
+        METRICS.write_textfile(METRICS_TEXTFILE)
+
+    print(summary)
+
+
+def cmd_upcoming(args: argparse.Namespace) -> None:
+    start = parse_date(args.start) if args.start else datetime.now(KST).date()
+    if not start:
+        raise SystemExit(f"invalid --from date: {args.start}")
+
+    store = state_store()
+    if store:
+        snapshot, history = store.effective_between(start, start + timedelta(days=args.days))
+    else:
+        _, snapshot, history = load_state(None)
+
+    out = build_upcoming(build_effective_index(snapshot, history), start, args.days)
+    if args.json:
+        print(json.dumps(out, ensure_ascii=False, indent=2))
+        return
+    for x in out["items"]:
+        print(f"{x['effectiveDate']}  D-{x['daysLeft']:<3} {x['code']:<10} {x['title']} ({x['revisionType'] or '-'})")
+    print(f"{len(out['items'])}건 ({out['from']} ~ +{out['days']}일)")
+
+
+def cmd_changes(args: argparse.Namespace) -> None:
+    store = state_store()
+    if store:
+        rows = store.changes_for(args.code)
+    else:
+        data = load_json("data.json", {"lastRun": None, "records": []})
+        rows = [
+            {"date": rec["date"], **ch}
+            for rec in data.get("records", [])
+            for ch in rec.get("changes", [])
+            if ch.get("code") == args.code
+        ]
+    for r in rows:
+        print(f"{r['date']}  {r['code']:<10} {r.get('status', '')}  {r.get('title', '')}")
+    print(f"{len(rows)}건")
+
+
+def cmd_backfill(args: argparse.Namespace) -> None:
+    pool = key_pool()
+    scopes = [(k, f"standards_{k}.json") for k in ("nfpc", "nftc") if args.scope in ("all", k)]
+    store = state_store()
+    history, added, failed = backfill(scopes, args.workers)
+
+    _, snapshot, _ = load_state(store)
+    if store:
+        store.save_history(history)
+        store.export_json()
+    else:
+        save_json(HISTORY_FILE, history)
+    save_json(UPCOMING_FILE, build_upcoming(build_effective_index(snapshot, history), datetime.now(KST).date(), UPCOMING_DAYS))
+    save_json(KEY_STATE_FILE, pool.state())
+
+    if METRICS_TEXTFILE:
+        METRICS.write_textfile(METRICS_TEXTFILE)
+
+    print(f"backfill: 연혁 {added}건 추가 / 실패 {len(failed)}건")
+    if failed:
+        print("재실행하면 캐시된 결과는 건너뛰고 실패분만 다시 조회합니다: " + ", ".join(failed))
+
+
+def cmd_db(args: argparse.Namespace) -> None:
+    store = SqliteStore(args.db)
+    if args.action == "import":
+        store.import_json()
+        print(f"imported JSON state into {args.db}")
+    else:
+        store.export_json()
+        print(f"exported {args.db} to JSON")
+
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = METRICS.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        return
+
+
+def cmd_serve(args: argparse.Namespace) -> None:
+    """장기 실행 모드: interval마다 검사를 돌리고 /metrics를 노출한다."""
+    global TODAY, _KEY_POOL
+    server = ThreadingHTTPServer(("", args.port), MetricsHandler)
+    threading.Thread(target=server.serve_forever, name="metrics", daemon=True).start()
+    print(f"metrics on :{args.port}/metrics, interval {args.interval}s")
+
+    while True:
+        # 날짜가 바뀌면 키 쿼터도 새로 세도록 실행마다 다시 읽는다.
+        TODAY = datetime.now(KST).strftime("%Y-%m-%d")
+        _KEY_POOL = None
+        try:
+            main()
+        except Exception as e:
+            METRICS.inc("nfpc_run_failures_total")
+            print(f"run failed: {e}")
+        time.sleep(args.interval)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="NFPC/NFTC 자동검토")
+    sub = parser.add_subparsers(dest="command")
+
+    p_up = sub.add_parser("upcoming", help="시행 예정 기준 조회")
+    p_up.add_argument("--days", type=int, default=UPCOMING_DAYS)
+    p_up.add_argument("--from", dest="start", default="")
+    p_up.add_argument("--json", action="store_true")
+
+    p_ch = sub.add_parser("changes", help="기준 코드별 변경 이력 조회")
+    p_ch.add_argument("code")
+
+    p_bf = sub.add_parser("backfill", help="법제처 연혁으로 history.json 일괄 채우기")
+    p_bf.add_argument("--scope", choices=["all", "nfpc", "nftc"], default="all")
+    p_bf.add_argument("--workers", type=int, default=BACKFILL_WORKERS)
+
+    p_db = sub.add_parser("db", help="SQLite 상태 저장소 가져오기/내보내기")
+    p_db.add_argument("action", choices=["import", "export"])
+    p_db.add_argument("--db", default=STATE_DB)
+
+    p_sv = sub.add_parser("serve", help="주기 실행 + /metrics HTTP 엔드포인트")
+    p_sv.add_argument("--port", type=int, default=METRICS_PORT)
+    p_sv.add_argument("--interval", type=int, default=SERVE_INTERVAL)
+
+    args = parser.parse_args()
+    if args.command == "upcoming":
+        cmd_upcoming(args)
+    elif args.command == "changes":
+        cmd_changes(args)
+    elif args.command == "backfill":
+        cmd_backfill(args)
+    elif args.command == "db":
+        cmd_db(args)
+    elif args.command == "serve":
+        cmd_serve(args)
+    else:
+        main()